@@ -3,12 +3,16 @@ Assessment Tools - Claude Code Prompting 101
 Comprehensive assessment system for validating learning outcomes.
 """
 
+import copy
 import json
 import time
 import random
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 
 
 class QuestionType(Enum):
@@ -20,6 +24,40 @@ class QuestionType(Enum):
     SCENARIO = "scenario"
 
 
+# Minimum keyword coverage for open-ended question types to count as correct
+OPEN_RESPONSE_THRESHOLDS = {
+    QuestionType.SHORT_ANSWER: 0.4,  # 40% keyword overlap
+    QuestionType.PRACTICAL: 0.3,  # 30% for more complex responses
+    QuestionType.SCENARIO: 0.3
+}
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset:
+    """Lowercased keyword set for a piece of text
+    
+    Cached because batch grading sees the same answer strings many times.
+    """
+    return frozenset(text.lower().split())
+
+
+class Chapter(IntEnum):
+    """Course chapters; integer-valued so comparisons and indexing stay cheap"""
+    CH1 = 1
+    CH2 = 2
+    CH3 = 3
+    CH4 = 4
+    CH5 = 5
+    CH6 = 6
+    CH7 = 7
+    CH8 = 8
+    
+    @property
+    def label(self) -> str:
+        """Zero-padded display form, e.g. "01" """
+        return f"{self.value:02d}"
+
+
 class DifficultyLevel(Enum):
     """Question difficulty levels"""
     BASIC = "basic"
@@ -36,11 +74,11 @@ class LearningObjective(Enum):
     EVALUATION = "evaluation"
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """Assessment question structure"""
     id: str
-    chapter: str
+    chapter: Chapter
     type: QuestionType
     difficulty: DifficultyLevel
     objective: LearningObjective
@@ -50,22 +88,44 @@ class Question:
     explanation: str = ""
     points: int = 1
     tags: List[str] = None
+    normalized_answer: str = field(init=False, repr=False, compare=False)
+    answer_keywords: frozenset = field(init=False, repr=False, compare=False)
+    correct_option: Optional[int] = field(init=False, repr=False, compare=False)  # 1-based, as displayed
+    
+    def __post_init__(self):
+        # The correct answer never changes, so normalize and tokenize it once
+        self.normalized_answer = self.correct_answer.strip().lower()
+        self.answer_keywords = _tokenize(self.correct_answer)
+        
+        # Options are shown numbered, so students may answer with the number
+        option_norms = [option.strip().lower() for option in self.options or ()]
+        if self.normalized_answer in option_norms:
+            self.correct_option = option_norms.index(self.normalized_answer) + 1
+        else:
+            self.correct_option = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Assessment:
     """Complete assessment structure"""
     id: str
     title: str
     description: str
-    chapters_covered: List[str]
+    chapters_covered: List[Chapter]
     questions: List[Question]
     time_limit: int  # minutes
     passing_score: float  # percentage
     instructions: str
+    total_points: int = field(init=False, repr=False, compare=False)
+    question_index: Dict[str, Question] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Cached once so scoring doesn't rescan the question list per response
+        self.total_points = sum(q.points for q in self.questions)
+        self.question_index = {q.id: q for q in self.questions}
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentResponse:
     """Student's response to a question"""
     question_id: str
@@ -74,7 +134,7 @@ class StudentResponse:
     confidence: int  # 1-5 scale
 
 
-@dataclass
+@dataclass(slots=True)
 class AssessmentResult:
     """Assessment results and scoring"""
     assessment_id: str
@@ -93,8 +153,18 @@ class AssessmentEngine:
     
     def __init__(self):
         self.questions = self._create_question_bank()
-        self.assessments = self._create_assessments()
+        self.question_positions = {question_id: i for i, question_id in enumerate(self.questions)}
+        self.question_indexes = self._build_question_indexes()
+        self.chapters = sorted(self.question_indexes["chapter"])
+        self.chapter_index = {chapter: i for i, chapter in enumerate(self.chapters)}
+        self.keyword_vocabulary, self.keyword_masks = self._build_keyword_masks()
+        self.required_overlap = self._build_required_overlap()
+        self.answer_checks = {q.id: self._build_answer_check(q) for q in self.questions.values()}
+        self.assessment_specs = self._create_assessment_specs()
+        self.assessments: Dict[str, Assessment] = {}  # Built lazily by get_assessment
+        self.assessment_scorers: Dict[str, Callable[[List[StudentResponse]], Tuple[int, Dict[str, bool]]]] = {}
         self.results = []
+        self._analytics_cache: Dict[Optional[str], Dict] = {}  # Cleared on every submission
     
     def _create_question_bank(self) -> Dict[str, Question]:
         """Create comprehensive question bank"""
@@ -104,7 +174,7 @@ class AssessmentEngine:
         # Chapter 1 Questions
         questions["ch1_q1"] = Question(
             id="ch1_q1",
-            chapter="01",
+            chapter=Chapter.CH1,
             type=QuestionType.MULTIPLE_CHOICE,
             difficulty=DifficultyLevel.BASIC,
             objective=LearningObjective.UNDERSTANDING,
@@ -123,7 +193,7 @@ class AssessmentEngine:
         
         questions["ch1_q2"] = Question(
             id="ch1_q2",
-            chapter="01",
+            chapter=Chapter.CH1,
             type=QuestionType.TRUE_FALSE,
             difficulty=DifficultyLevel.BASIC,
             objective=LearningObjective.UNDERSTANDING,
@@ -136,7 +206,7 @@ class AssessmentEngine:
         
         questions["ch1_q3"] = Question(
             id="ch1_q3",
-            chapter="01",
+            chapter=Chapter.CH1,
             type=QuestionType.SCENARIO,
             difficulty=DifficultyLevel.INTERMEDIATE,
             objective=LearningObjective.APPLICATION,
@@ -150,7 +220,7 @@ class AssessmentEngine:
         # Chapter 2 Questions
         questions["ch2_q1"] = Question(
             id="ch2_q1",
-            chapter="02",
+            chapter=Chapter.CH2,
             type=QuestionType.MULTIPLE_CHOICE,
             difficulty=DifficultyLevel.BASIC,
             objective=LearningObjective.UNDERSTANDING,
@@ -169,7 +239,7 @@ class AssessmentEngine:
         
         questions["ch2_q2"] = Question(
             id="ch2_q2",
-            chapter="02",
+            chapter=Chapter.CH2,
             type=QuestionType.PRACTICAL,
             difficulty=DifficultyLevel.INTERMEDIATE,
             objective=LearningObjective.APPLICATION,
@@ -199,7 +269,7 @@ You are a travel planning assistant helping users create personalized itinerarie
         # Chapter 3 Questions
         questions["ch3_q1"] = Question(
             id="ch3_q1",
-            chapter="03",
+            chapter=Chapter.CH3,
             type=QuestionType.SHORT_ANSWER,
             difficulty=DifficultyLevel.INTERMEDIATE,
             objective=LearningObjective.ANALYSIS,
@@ -215,55 +285,198 @@ You are a travel planning assistant helping users create personalized itinerarie
         
         return questions
     
-    def _create_assessments(self) -> Dict[str, Assessment]:
-        """Create different types of assessments"""
+    def _build_question_indexes(self) -> Dict[str, Dict[Any, List[str]]]:
+        """Index question IDs by chapter and by learning objective
+        
+        Built in one pass over the bank so assessments select their
+        questions by key lookup instead of filtering every question.
+        """
+        indexes = {"chapter": defaultdict(list), "objective": defaultdict(list)}
+        for question in self.questions.values():
+            indexes["chapter"][question.chapter].append(question.id)
+            indexes["objective"][question.objective].append(question.id)
+        return indexes
+    
+    def _select_questions(self, field_name: str, values: List[Any]) -> List[Question]:
+        """Questions whose `field_name` is one of `values`, in question-bank order"""
+        index = self.question_indexes[field_name]
+        question_ids = [question_id for value in values for question_id in index.get(value, ())]
+        question_ids.sort(key=self.question_positions.__getitem__)
+        return [self.questions[question_id] for question_id in question_ids]
+    
+    def _build_keyword_masks(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Encode each question's answer keywords as an integer bitmask
+        
+        Every distinct keyword in the bank gets a bit position, so keyword
+        overlap becomes a bitwise AND plus a popcount instead of a set
+        intersection.
+        """
+        vocabulary = {}
+        masks = {}
+        for question in self.questions.values():
+            mask = 0
+            for keyword in question.answer_keywords:
+                bit = vocabulary.setdefault(keyword, len(vocabulary))
+                mask |= 1 << bit
+            masks[question.id] = mask
+        return vocabulary, masks
+    
+    def _build_required_overlap(self) -> Dict[str, int]:
+        """Convert coverage thresholds into minimum keyword-overlap counts
+        
+        Scoring then compares two integers instead of dividing per response.
+        Questions that cannot pass (no keywords or no threshold) are omitted.
+        """
+        required = {}
+        for question in self.questions.values():
+            threshold = OPEN_RESPONSE_THRESHOLDS.get(question.type)
+            total = len(question.answer_keywords)
+            if threshold is None or not total:
+                continue
+            required[question.id] = next(k for k in range(total + 1) if k / total >= threshold)
+        return required
+    
+    def _keyword_mask(self, text: str) -> int:
+        """Bitmask of the vocabulary keywords that appear in text"""
+        vocabulary = self.keyword_vocabulary
+        mask = 0
+        for word in _tokenize(text):
+            bit = vocabulary.get(word)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+    
+    def _build_answer_check(self, question: Question) -> Callable[[str], bool]:
+        """Specialize the correctness check for one question
+        
+        Type dispatch and answer normalization happen here, once per
+        question, so scoring a response is a single call on its answer.
+        """
+        if question.type in [QuestionType.MULTIPLE_CHOICE, QuestionType.TRUE_FALSE]:
+            expected = question.normalized_answer
+            correct_option = question.correct_option
+            if correct_option is None:
+                return lambda answer: answer.strip().lower() == expected
+            
+            def check_choice(answer: str) -> bool:
+                answer = answer.strip().lower()
+                if answer.isdecimal():
+                    return int(answer) == correct_option
+                return answer == expected
+            
+            return check_choice
+        
+        # For open-ended questions, use keyword matching or semantic similarity
+        # In a real system, this would use more sophisticated NLP.
+        # Different thresholds for different question types are precomputed
+        # as the number of answer keywords the response must contain.
+        required = self.required_overlap.get(question.id)
+        if required is None:
+            return lambda answer: False
+        
+        correct_mask = self.keyword_masks[question.id]
+        keyword_mask = self._keyword_mask
+        
+        def check(answer: str) -> bool:
+            # The overlap can never exceed the number of distinct words in the
+            # answer, so short answers fail without building a mask
+            if len(_tokenize(answer)) < required:
+                return False
+            return (correct_mask & keyword_mask(answer)).bit_count() >= required
+        
+        return check
+    
+    def _build_assessment_scorer(self, assessment: Assessment) -> Callable[[List[StudentResponse]], Tuple[int, Dict[str, bool]]]:
+        """Bind point values and answer checks for one assessment up front
+        
+        The returned function scores a list of responses and returns the
+        earned points plus a {question_id: is_correct} map.
+        """
+        scoring_table = {q.id: (q.points, self.answer_checks[q.id]) for q in assessment.questions}
+        
+        def score(responses: List[StudentResponse]) -> Tuple[int, Dict[str, bool]]:
+            earned_points = 0
+            correctness = {}
+            for response in responses:
+                entry = scoring_table.get(response.question_id)
+                if entry is None:
+                    continue
+                points, check = entry
+                is_correct = check(response.answer)
+                correctness[response.question_id] = is_correct
+                if is_correct:
+                    earned_points += points
+            return earned_points, correctness
+        
+        return score
+    
+    def _create_assessment_specs(self) -> Dict[str, Dict[str, Any]]:
+        """Define the available assessments
+        
+        Each spec holds the Assessment metadata plus a `question_selection`
+        of (indexed field, values). Question lists are only materialized by
+        get_assessment, so assessments nobody takes are never built.
+        """
         
-        assessments = {}
+        specs = {}
         
         # Chapter 1 Quiz
-        ch1_questions = [q for q in self.questions.values() if q.chapter == "01"]
-        assessments["ch1_quiz"] = Assessment(
-            id="ch1_quiz",
-            title="Chapter 1: Introduction to Prompt Engineering - Quiz",
-            description="Basic knowledge check for Chapter 1 concepts",
-            chapters_covered=["01"],
-            questions=ch1_questions,
-            time_limit=15,
-            passing_score=0.7,
-            instructions="Answer all questions to assess your understanding of basic prompt engineering concepts."
-        )
+        specs["ch1_quiz"] = {
+            "question_selection": ("chapter", [Chapter.CH1]),
+            "title": "Chapter 1: Introduction to Prompt Engineering - Quiz",
+            "description": "Basic knowledge check for Chapter 1 concepts",
+            "chapters_covered": [Chapter.CH1],
+            "time_limit": 15,
+            "passing_score": 0.7,
+            "instructions": "Answer all questions to assess your understanding of basic prompt engineering concepts."
+        }
         
         # Comprehensive Midterm
-        midterm_questions = [q for q in self.questions.values() if q.chapter in ["01", "02", "03", "04"]]
-        assessments["midterm"] = Assessment(
-            id="midterm",
-            title="Midterm Assessment: Foundations of Prompt Engineering",
-            description="Comprehensive assessment covering Chapters 1-4",
-            chapters_covered=["01", "02", "03", "04"],
-            questions=midterm_questions,
-            time_limit=60,
-            passing_score=0.75,
-            instructions="This assessment covers fundamental concepts from the first four chapters. Take your time and read questions carefully."
-        )
+        specs["midterm"] = {
+            "question_selection": ("chapter", [Chapter.CH1, Chapter.CH2, Chapter.CH3, Chapter.CH4]),
+            "title": "Midterm Assessment: Foundations of Prompt Engineering",
+            "description": "Comprehensive assessment covering Chapters 1-4",
+            "chapters_covered": [Chapter.CH1, Chapter.CH2, Chapter.CH3, Chapter.CH4],
+            "time_limit": 60,
+            "passing_score": 0.75,
+            "instructions": "This assessment covers fundamental concepts from the first four chapters. Take your time and read questions carefully."
+        }
         
         # Final Practical Assessment
-        practical_questions = [q for q in self.questions.values() if q.objective in [LearningObjective.APPLICATION, LearningObjective.SYNTHESIS]]
-        assessments["final_practical"] = Assessment(
-            id="final_practical",
-            title="Final Practical Assessment: Complete Prompt Engineering",
-            description="Hands-on assessment requiring complete prompt creation",
-            chapters_covered=["01", "02", "03", "04", "05", "06", "07", "08"],
-            questions=practical_questions,
-            time_limit=120,
-            passing_score=0.8,
-            instructions="Create complete, production-ready prompts for given scenarios. Focus on applying all course concepts."
-        )
+        specs["final_practical"] = {
+            "question_selection": ("objective", [LearningObjective.APPLICATION, LearningObjective.SYNTHESIS]),
+            "title": "Final Practical Assessment: Complete Prompt Engineering",
+            "description": "Hands-on assessment requiring complete prompt creation",
+            "chapters_covered": list(Chapter),
+            "time_limit": 120,
+            "passing_score": 0.8,
+            "instructions": "Create complete, production-ready prompts for given scenarios. Focus on applying all course concepts."
+        }
         
-        return assessments
+        return specs
     
     def get_assessment(self, assessment_id: str) -> Optional[Assessment]:
-        """Get assessment by ID"""
-        return self.assessments.get(assessment_id)
+        """Get assessment by ID, building it on first request"""
+        assessment = self.assessments.get(assessment_id)
+        if assessment is None:
+            spec = self.assessment_specs.get(assessment_id)
+            if spec is None:
+                return None
+            
+            metadata = dict(spec)
+            field_name, values = metadata.pop("question_selection")
+            assessment = Assessment(
+                id=assessment_id,
+                questions=self._select_questions(field_name, values),
+                **metadata
+            )
+            self.assessments[assessment_id] = assessment
+            self.assessment_scorers[assessment_id] = self._build_assessment_scorer(assessment)
+        return assessment
+    
+    def list_assessments(self) -> List[str]:
+        """List all available assessments without building them"""
+        return [f"{assessment_id}: {spec['title']}" for assessment_id, spec in self.assessment_specs.items()]
     
     def start_assessment(self, assessment_id: str, student_id: str = "anonymous") -> Dict:
         """Start an assessment session"""
@@ -271,15 +484,18 @@ You are a travel planning assistant helping users create personalized itinerarie
         if not assessment:
             return {"error": "Assessment not found"}
         
-        # Randomize question order for some assessments
-        questions = assessment.questions.copy()
-        if assessment_id != "final_practical":  # Keep practical in logical order
+        # Randomize question order for some assessments; the practical keeps its
+        # logical order and shares the assessment's list, which is never mutated
+        if assessment_id != "final_practical":
+            questions = list(assessment.questions)
             random.shuffle(questions)
+        else:
+            questions = assessment.questions
         
         return {
             "assessment": assessment,
             "questions": questions,
-            "start_time": time.time(),
+            "start_time": time.perf_counter(),
             "student_id": student_id,
             "instructions": f"""
 === {assessment.title} ===
@@ -297,14 +513,17 @@ Press Enter to begin...
         }
     
     def submit_assessment(self, assessment_id: str, student_id: str, responses: List[StudentResponse], start_time: float) -> AssessmentResult:
-        """Submit and score assessment"""
+        """Submit and score assessment
+        
+        `start_time` is the perf_counter() value returned by start_assessment.
+        """
         assessment = self.get_assessment(assessment_id)
         if not assessment:
             raise ValueError("Assessment not found")
         
         # Calculate scoring
-        total_points = sum(q.points for q in assessment.questions)
-        earned_points = 0
+        total_points = assessment.total_points
+        earned_points, correctness = self.assessment_scorers[assessment_id](responses)
         
         feedback = {
             "question_feedback": {},
@@ -313,16 +532,13 @@ Press Enter to begin...
             "recommendations": []
         }
         
-        # Score each response
+        # Per-question feedback for each scored response
         for response in responses:
-            question = next((q for q in assessment.questions if q.id == response.question_id), None)
-            if not question:
+            is_correct = correctness.get(response.question_id)
+            if is_correct is None:
                 continue
             
-            is_correct = self._score_response(question, response)
-            if is_correct:
-                earned_points += question.points
-            
+            question = assessment.question_index[response.question_id]
             feedback["question_feedback"][response.question_id] = {
                 "correct": is_correct,
                 "your_answer": response.answer,
@@ -335,10 +551,10 @@ Press Enter to begin...
         score = earned_points / total_points if total_points > 0 else 0
         percentage = score * 100
         passed = score >= assessment.passing_score
-        time_taken = time.time() - start_time
+        time_taken = time.perf_counter() - start_time
         
         # Generate feedback
-        feedback.update(self._generate_assessment_feedback(assessment, responses, score))
+        feedback.update(self._generate_assessment_feedback(assessment, responses, score, correctness))
         
         result = AssessmentResult(
             assessment_id=assessment_id,
@@ -348,50 +564,31 @@ Press Enter to begin...
             percentage=percentage,
             passed=passed,
             time_taken=time_taken,
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=datetime.now().isoformat(timespec='seconds'),
             feedback=feedback
         )
         
         self.results.append(result)
+        self._analytics_cache.clear()
         return result
     
     def _score_response(self, question: Question, response: StudentResponse) -> bool:
         """Score individual response"""
-        
-        if question.type == QuestionType.MULTIPLE_CHOICE:
-            return response.answer.strip().lower() == question.correct_answer.strip().lower()
-        
-        elif question.type == QuestionType.TRUE_FALSE:
-            return response.answer.strip().lower() == question.correct_answer.strip().lower()
-        
-        elif question.type in [QuestionType.SHORT_ANSWER, QuestionType.PRACTICAL, QuestionType.SCENARIO]:
-            # For open-ended questions, use keyword matching or semantic similarity
-            # In a real system, this would use more sophisticated NLP
-            return self._evaluate_open_response(question, response)
-        
-        return False
+        return self.answer_checks[question.id](response.answer)
     
-    def _evaluate_open_response(self, question: Question, response: StudentResponse) -> bool:
-        """Evaluate open-ended responses (simplified version)"""
-        
-        # Extract key terms from correct answer
-        correct_keywords = set(question.correct_answer.lower().split())
-        response_keywords = set(response.answer.lower().split())
-        
-        # Simple keyword overlap scoring
-        overlap = len(correct_keywords.intersection(response_keywords))
-        coverage = overlap / len(correct_keywords) if correct_keywords else 0
-        
-        # Different thresholds for different question types
-        if question.type == QuestionType.SHORT_ANSWER:
-            return coverage >= 0.4  # 40% keyword overlap
-        elif question.type in [QuestionType.PRACTICAL, QuestionType.SCENARIO]:
-            return coverage >= 0.3  # 30% for more complex responses
-        
-        return False
+    def evaluate_open_responses(self, question_id: str, answers: List[str]) -> List[bool]:
+        """Score many answers to one open-ended question, e.g. a whole cohort"""
+        check = self.answer_checks.get(question_id)
+        if check is None:
+            return [False] * len(answers)
+        return [check(answer) for answer in answers]
     
-    def _generate_assessment_feedback(self, assessment: Assessment, responses: List[StudentResponse], score: float) -> Dict:
-        """Generate personalized feedback based on performance"""
+    def _generate_assessment_feedback(self, assessment: Assessment, responses: List[StudentResponse], score: float, correctness: Dict[str, bool]) -> Dict:
+        """Generate personalized feedback based on performance
+        
+        `correctness` maps question IDs to the results already computed by
+        submit_assessment, so responses are not scored a second time.
+        """
         
         feedback = {
             "strengths": [],
@@ -399,25 +596,26 @@ Press Enter to begin...
             "recommendations": []
         }
         
-        # Analyze performance by chapter
-        chapter_performance = {}
+        # Analyze performance by chapter, using counters indexed by chapter
+        chapter_correct = [0] * len(self.chapters)
+        chapter_total = [0] * len(self.chapters)
         for response in responses:
-            question = next((q for q in assessment.questions if q.id == response.question_id), None)
+            question = assessment.question_index.get(response.question_id)
             if question:
-                if question.chapter not in chapter_performance:
-                    chapter_performance[question.chapter] = {"correct": 0, "total": 0}
-                chapter_performance[question.chapter]["total"] += 1
-                if self._score_response(question, response):
-                    chapter_performance[question.chapter]["correct"] += 1
+                index = self.chapter_index[question.chapter]
+                chapter_total[index] += 1
+                chapter_correct[index] += bool(correctness.get(response.question_id))
         
         # Generate feedback based on performance
-        for chapter, perf in chapter_performance.items():
-            chapter_score = perf["correct"] / perf["total"] if perf["total"] > 0 else 0
+        for chapter, correct, total in zip(self.chapters, chapter_correct, chapter_total):
+            if not total:
+                continue
+            chapter_score = correct / total
             if chapter_score >= 0.8:
-                feedback["strengths"].append(f"Strong understanding of Chapter {chapter} concepts")
+                feedback["strengths"].append(f"Strong understanding of Chapter {chapter.label} concepts")
             elif chapter_score < 0.6:
-                feedback["areas_for_improvement"].append(f"Review Chapter {chapter} material")
-                feedback["recommendations"].append(f"Complete additional exercises for Chapter {chapter}")
+                feedback["areas_for_improvement"].append(f"Review Chapter {chapter.label} material")
+                feedback["recommendations"].append(f"Complete additional exercises for Chapter {chapter.label}")
         
         # Overall performance feedback
         if score >= 0.9:
@@ -431,7 +629,15 @@ Press Enter to begin...
         return feedback
     
     def generate_performance_analytics(self, student_id: str = None) -> Dict:
-        """Generate performance analytics"""
+        """Generate performance analytics
+        
+        Results are cached per student_id until the next submission; callers
+        get their own copy, so editing one never changes the cached analytics.
+        """
+        
+        cached = self._analytics_cache.get(student_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
         
         results = self.results
         if student_id:
@@ -440,29 +646,36 @@ Press Enter to begin...
         if not results:
             return {"message": "No results found"}
         
+        # Single pass: per-assessment [attempts, score_sum, passes]
+        breakdown_totals = defaultdict(lambda: [0, 0.0, 0])
+        score_sum = 0.0
+        passes = 0
+        for result in results:
+            totals = breakdown_totals[result.assessment_id]
+            totals[0] += 1
+            totals[1] += result.percentage
+            totals[2] += result.passed
+            score_sum += result.percentage
+            passes += result.passed
+        
         analytics = {
             "total_assessments": len(results),
-            "average_score": sum(r.percentage for r in results) / len(results),
-            "pass_rate": sum(1 for r in results if r.passed) / len(results),
+            "average_score": score_sum / len(results),
+            "pass_rate": passes / len(results),
             "assessment_breakdown": {},
             "improvement_trends": []
         }
         
         # Breakdown by assessment type
-        for result in results:
-            if result.assessment_id not in analytics["assessment_breakdown"]:
-                analytics["assessment_breakdown"][result.assessment_id] = {
-                    "attempts": 0,
-                    "average_score": 0,
-                    "pass_rate": 0
-                }
-            
-            breakdown = analytics["assessment_breakdown"][result.assessment_id]
-            breakdown["attempts"] += 1
-            breakdown["average_score"] = (breakdown["average_score"] * (breakdown["attempts"] - 1) + result.percentage) / breakdown["attempts"]
-            breakdown["pass_rate"] = sum(1 for r in results if r.assessment_id == result.assessment_id and r.passed) / breakdown["attempts"]
+        for assessment_id, (attempts, assessment_score_sum, assessment_passes) in breakdown_totals.items():
+            analytics["assessment_breakdown"][assessment_id] = {
+                "attempts": attempts,
+                "average_score": assessment_score_sum / attempts,
+                "pass_rate": assessment_passes / attempts
+            }
         
-        return analytics
+        self._analytics_cache[student_id] = analytics
+        return copy.deepcopy(analytics)
 
 
 def interactive_assessment_session():
@@ -472,8 +685,8 @@ def interactive_assessment_session():
     
     print("=== Claude Code Prompting 101 Assessment System ===")
     print("Available Assessments:")
-    for assessment_id, assessment in engine.assessments.items():
-        print(f"  {assessment_id}: {assessment.title}")
+    for assessment_info in engine.list_assessments():
+        print(f"  {assessment_info}")
     
     while True:
         print("\nOptions:")
@@ -499,9 +712,10 @@ def interactive_assessment_session():
             responses = []
             start_time = session["start_time"]
             
+            question_count = len(session["questions"])
             for i, question in enumerate(session["questions"], 1):
-                print(f"\n=== Question {i} of {len(session['questions'])} ===")
-                print(f"Chapter: {question.chapter} | Difficulty: {question.difficulty.value}")
+                print(f"\n=== Question {i} of {question_count} ===")
+                print(f"Chapter: {question.chapter.label} | Difficulty: {question.difficulty.value}")
                 print(f"Points: {question.points}")
                 print(f"\n{question.question}")
                 
@@ -509,12 +723,14 @@ def interactive_assessment_session():
                     for j, option in enumerate(question.options, 1):
                         print(f"{j}. {option}")
                 
-                question_start = time.time()
+                question_start = time.perf_counter()
                 answer = input("\nYour answer: ").strip()
-                question_time = time.time() - question_start
+                question_time = time.perf_counter() - question_start
                 
-                confidence = input("Confidence (1-5, optional): ").strip()
-                confidence = int(confidence) if confidence.isdigit() else 3
+                try:
+                    confidence = int(input("Confidence (1-5, optional): "))
+                except ValueError:
+                    confidence = 3
                 
                 responses.append(StudentResponse(
                     question_id=question.id,
@@ -527,7 +743,7 @@ def interactive_assessment_session():
             result = engine.submit_assessment(assessment_id, student_id, responses, start_time)
             
             print(f"\n=== Assessment Results ===")
-            print(f"Score: {result.score}/{sum(q.points for q in session['questions'])} ({result.percentage:.1f}%)")
+            print(f"Score: {result.score}/{session['assessment'].total_points} ({result.percentage:.1f}%)")
             print(f"Status: {'PASSED' if result.passed else 'FAILED'}")
             print(f"Time Taken: {result.time_taken/60:.1f} minutes")
             
@@ -6,12 +6,12 @@ This module demonstrates the progression from basic prompts to structured prompt
 following the Swedish car insurance claim analysis use case.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PromptExample:
     """Structure for organizing prompt examples"""
     version: str
@@ -19,59 +19,62 @@ class PromptExample:
     system_prompt: str
     user_prompt: str
     expected_behavior: str
-    common_issues: List[str]
+    common_issues: Tuple[str, ...]
+    system_length: int = field(init=False, repr=False, compare=False)
+    user_length: int = field(init=False, repr=False, compare=False)
+    issue_count: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen instance, so the derived sizes are set through object.__setattr__
+        object.__setattr__(self, "system_length", len(self.system_prompt))
+        object.__setattr__(self, "user_length", len(self.user_prompt))
+        object.__setattr__(self, "issue_count", len(self.common_issues))
 
 
-class BasicPromptExamples:
-    """Collection of basic prompt examples demonstrating evolution"""
-    
-    def __init__(self):
-        self.examples = self._create_examples()
+def _create_examples() -> Dict[str, PromptExample]:
+    """Create the progression of prompt examples"""
     
-    def _create_examples(self) -> Dict[str, PromptExample]:
-        """Create the progression of prompt examples"""
+    return {
+        "version_1_basic": PromptExample(
+            version="1.0 - Basic (Problematic)",
+            description="Initial naive approach - demonstrates the problem",
+            system_prompt="",
+            user_prompt="""Review this accident report form and determine what happened in an accident and who's at fault.""",
+            expected_behavior="Likely to misinterpret the domain (skiing vs car accident)",
+            common_issues=(
+                "Domain confusion (thinks it's skiing accident)",
+                "No context about Swedish forms",
+                "No confidence constraints",
+                "Vague instructions"
+            )
+        ),
         
-        return {
-            "version_1_basic": PromptExample(
-                version="1.0 - Basic (Problematic)",
-                description="Initial naive approach - demonstrates the problem",
-                system_prompt="",
-                user_prompt="""Review this accident report form and determine what happened in an accident and who's at fault.""",
-                expected_behavior="Likely to misinterpret the domain (skiing vs car accident)",
-                common_issues=[
-                    "Domain confusion (thinks it's skiing accident)",
-                    "No context about Swedish forms",
-                    "No confidence constraints",
-                    "Vague instructions"
-                ]
-            ),
-            
-            "version_2_structured": PromptExample(
-                version="2.0 - Basic Structure",
-                description="Adding basic structure and context",
-                system_prompt="""You are analyzing Swedish car accident report forms.
+        "version_2_structured": PromptExample(
+            version="2.0 - Basic Structure",
+            description="Adding basic structure and context",
+            system_prompt="""You are analyzing Swedish car accident report forms.
 
 Please review the provided accident report form and determine:
 1. What happened in the accident
 2. Which vehicle was at fault
 
 Use clear reasoning based on the evidence provided.""",
-                user_prompt="""Please analyze the attached Swedish car accident report form and sketch.
+            user_prompt="""Please analyze the attached Swedish car accident report form and sketch.
 The form contains checkboxes for Vehicle A and Vehicle B, and there is an accompanying hand-drawn sketch of the incident.
 
 Provide your analysis and determination of fault.""",
-                expected_behavior="Correctly identifies it as a car accident, basic analysis",
-                common_issues=[
-                    "Still lacks domain-specific knowledge",
-                    "No confidence thresholds",
-                    "Limited error handling"
-                ]
-            ),
-            
-            "version_2_1_improved": PromptExample(
-                version="2.1 - Improved Structure",
-                description="Adding XML organization and clear sections",
-                system_prompt="""You are an AI assistant analyzing Swedish car accident report forms.
+            expected_behavior="Correctly identifies it as a car accident, basic analysis",
+            common_issues=(
+                "Still lacks domain-specific knowledge",
+                "No confidence thresholds",
+                "Limited error handling"
+            )
+        ),
+        
+        "version_2_1_improved": PromptExample(
+            version="2.1 - Improved Structure",
+            description="Adding XML organization and clear sections",
+            system_prompt="""You are an AI assistant analyzing Swedish car accident report forms.
 
 <role>
 You help insurance adjusters by analyzing standardized Swedish accident report forms and accompanying sketches to determine fault in vehicle accidents.
@@ -90,7 +93,7 @@ You help insurance adjusters by analyzing standardized Swedish accident report f
 - Give clear fault determination with confidence level
 - Reference specific evidence for conclusions
 </output_requirements>""",
-                user_prompt="""<accident_data>
+            user_prompt="""<accident_data>
 Please analyze the attached Swedish car accident report form and sketch.
 
 Form contains:
@@ -103,13 +106,24 @@ Sketch shows:
 </accident_data>
 
 Provide your complete analysis and fault determination.""",
-                expected_behavior="Better organized analysis with clear structure",
-                common_issues=[
-                    "Needs domain knowledge about Swedish forms",
-                    "Confidence handling could be improved"
-                ]
+            expected_behavior="Better organized analysis with clear structure",
+            common_issues=(
+                "Needs domain knowledge about Swedish forms",
+                "Confidence handling could be improved"
             )
-        }
+        )
+    }
+
+
+# Built once at import; the examples are immutable so every instance can share them
+_EXAMPLES: Dict[str, PromptExample] = _create_examples()
+
+
+class BasicPromptExamples:
+    """Collection of basic prompt examples demonstrating evolution"""
+    
+    def __init__(self):
+        self.examples = _EXAMPLES
     
     def get_example(self, version: str) -> Optional[PromptExample]:
         """Get a specific prompt example"""
@@ -130,24 +144,29 @@ Provide your complete analysis and fault determination.""",
         return {
             "version_1": {
                 "name": v1.version,
-                "system_length": len(v1.system_prompt),
-                "user_length": len(v1.user_prompt),
-                "issues": len(v1.common_issues)
+                "system_length": v1.system_length,
+                "user_length": v1.user_length,
+                "issues": v1.issue_count
             },
             "version_2": {
                 "name": v2.version,
-                "system_length": len(v2.system_prompt),
-                "user_length": len(v2.user_prompt),
-                "issues": len(v2.common_issues)
+                "system_length": v2.system_length,
+                "user_length": v2.user_length,
+                "issues": v2.issue_count
             },
             "improvements": {
-                "system_prompt_growth": len(v2.system_prompt) - len(v1.system_prompt),
-                "user_prompt_growth": len(v2.user_prompt) - len(v1.user_prompt),
-                "issue_reduction": len(v1.common_issues) - len(v2.common_issues)
+                "system_prompt_growth": v2.system_length - v1.system_length,
+                "user_prompt_growth": v2.user_length - v1.user_length,
+                "issue_reduction": v1.issue_count - v2.issue_count
             }
         }
 
 
+def _dumps_bytes(data: Dict) -> bytes:
+    """Serialize to compact JSON bytes"""
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
 def demonstrate_prompt_evolution():
     """Demonstrate the evolution of prompts from basic to structured"""
     
@@ -161,8 +180,8 @@ def demonstrate_prompt_evolution():
         print(f"Description: {example.description}")
         print(f"Expected Behavior: {example.expected_behavior}")
         print(f"Common Issues: {', '.join(example.common_issues)}")
-        print(f"System Prompt Length: {len(example.system_prompt)} characters")
-        print(f"User Prompt Length: {len(example.user_prompt)} characters")
+        print(f"System Prompt Length: {example.system_length} characters")
+        print(f"User Prompt Length: {example.user_length} characters")
         print("-" * 50)
     
     # Show comparison
@@ -171,11 +190,15 @@ def demonstrate_prompt_evolution():
     print(json.dumps(comparison, indent=2))
 
 
+def _cached_text_block(text: str) -> Dict:
+    """Wrap static prompt text in a content block marked for prompt caching"""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
 def create_api_request(version: str, content: str = None) -> Dict:
     """Create a properly formatted API request"""
     
-    examples = BasicPromptExamples()
-    example = examples.get_example(version)
+    example = _EXAMPLES.get(version)
     
     if not example:
         return {"error": f"Version {version} not found"}
@@ -187,17 +210,17 @@ def create_api_request(version: str, content: str = None) -> Dict:
         "messages": []
     }
     
-    # Add system message if present
+    # Static prompt text is marked for prompt caching so repeat requests reuse it
     if example.system_prompt:
         request["messages"].append({
             "role": "system",
-            "content": example.system_prompt
+            "content": [_cached_text_block(example.system_prompt)]
         })
     
-    # Add user message
-    user_content = example.user_prompt
+    # Add user message; caller content goes in its own uncached block after the cached prefix
+    user_content = [_cached_text_block(example.user_prompt)]
     if content:
-        user_content += f"\n\n{content}"
+        user_content.append({"type": "text", "text": content})
     
     request["messages"].append({
         "role": "user", 
@@ -207,5 +230,34 @@ def create_api_request(version: str, content: str = None) -> Dict:
     return request
 
 
+def create_api_request_bytes(version: str, content: str = None) -> bytes:
+    """Create an API request already serialized as a JSON body"""
+    return _dumps_bytes(create_api_request(version, content))
+
+
+def _batch_entry(index: int, version: str, content: str) -> Dict:
+    """Wrap one request as a Message Batches entry"""
+    return {"custom_id": f"{version}-{index}", "params": create_api_request(version, content)}
+
+
+def create_api_batch_request(jobs: List[Tuple[str, str]]) -> List[Dict]:
+    """Create Message Batches API entries for (version, content) jobs"""
+    
+    return [_batch_entry(i, version, content) for i, (version, content) in enumerate(jobs)]
+
+
+def write_api_batch_file(jobs: List[Tuple[str, str]], path: str) -> int:
+    """Write Message Batches entries as JSON Lines, one request at a time"""
+    
+    count = 0
+    with open(path, "wb") as f:
+        for i, (version, content) in enumerate(jobs):
+            f.write(_dumps_bytes(_batch_entry(i, version, content)))
+            f.write(b"\n")
+            count += 1
+    
+    return count
+
+
 if __name__ == "__main__":
     demonstrate_prompt_evolution()
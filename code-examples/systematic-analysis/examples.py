@@ -6,52 +6,56 @@ This module demonstrates how to create step-by-step instructions that guide
 Claude through systematic analysis processes.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import copy
+from typing import Dict, List, Optional, Any, Tuple, Final
+from dataclasses import dataclass, field
 from enum import Enum
 
 
-class AnalysisStep(Enum):
-    """Types of analysis steps"""
-    EXAMINATION = "examination"
-    INTERPRETATION = "interpretation"
-    CROSS_REFERENCE = "cross_reference"
-    VALIDATION = "validation"
-    CONCLUSION = "conclusion"
+class AnalysisStep(str, Enum):
+    """Types of analysis steps, valued by their display label"""
+    EXAMINATION = "Examination"
+    INTERPRETATION = "Interpretation"
+    CROSS_REFERENCE = "Cross_Reference"
+    VALIDATION = "Validation"
+    CONCLUSION = "Conclusion"
+    
+    # Format as the bare label on every Python version
+    __str__ = str.__str__
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstructionStep:
     """Individual instruction step"""
     step_number: int
     step_type: AnalysisStep
     instruction: str
     output_format: str
-    validation_criteria: List[str]
-    dependencies: List[int] = None  # Which steps must complete first
+    validation_criteria: Tuple[str, ...]
+    dependencies: Tuple[int, ...] = ()  # Which steps must complete first
+    header: str = field(init=False, repr=False, compare=False)
+    criteria_lines: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Checklist lines are fixed per step; frozen, so set through object.__setattr__
+        object.__setattr__(self, "header", f"☐ Step {self.step_number}: {self.step_type}")
+        object.__setattr__(self, "criteria_lines", tuple(f"  ☐ {criteria}" for criteria in self.validation_criteria))
 
 
-class SystematicAnalysisFramework:
-    """Framework for creating systematic analysis instructions"""
+def _build_insurance_steps() -> List[InstructionStep]:
+    """Create the insurance analysis step sequence"""
     
-    def __init__(self):
-        self.analysis_steps = self._create_analysis_steps()
-        self.complete_examples = self._create_complete_examples()
-    
-    def _create_analysis_steps(self) -> Dict[str, List[InstructionStep]]:
-        """Create systematic analysis step sequences"""
-        
-        insurance_steps = [
-            InstructionStep(
-                step_number=1,
-                step_type=AnalysisStep.EXAMINATION,
-                instruction="""Examine the accident report form systematically:
+    return [
+        InstructionStep(
+            step_number=1,
+            step_type=AnalysisStep.EXAMINATION,
+            instruction="""Examine the accident report form systematically:
 - Review Vehicle A checkboxes 1-17 individually
 - Review Vehicle B checkboxes 1-17 individually  
 - Note the type of marking for each selection (X, check, circle, light mark)
 - Identify any unclear or ambiguous markings
 - Create a complete inventory before moving to interpretation""",
-                output_format="""<form_inventory>
+            output_format="""<form_inventory>
 Vehicle A Markings:
 - Checkbox 1: [Clear X | Light mark | No marking | Unclear]
 - Checkbox 2: [Clear X | Light mark | No marking | Unclear]
@@ -61,23 +65,23 @@ Vehicle B Markings:
 - Checkbox 1: [Clear X | Light mark | No marking | Unclear]
 [... continue for all 17 checkboxes]
 </form_inventory>""",
-                validation_criteria=[
-                    "All 17 checkboxes reviewed for each vehicle",
-                    "Marking type specified for each checkbox",
-                    "Unclear markings explicitly identified"
-                ]
-            ),
-            
-            InstructionStep(
-                step_number=2,
-                step_type=AnalysisStep.EXAMINATION,
-                instruction="""Analyze the hand-drawn sketch systematically:
+            validation_criteria=(
+                "All 17 checkboxes reviewed for each vehicle",
+                "Marking type specified for each checkbox",
+                "Unclear markings explicitly identified"
+            )
+        ),
+        
+        InstructionStep(
+            step_number=2,
+            step_type=AnalysisStep.EXAMINATION,
+            instruction="""Analyze the hand-drawn sketch systematically:
 - Identify vehicle positions and orientations
 - Determine movement directions and paths
 - Note road layout, intersections, and traffic control devices
 - Assess sketch clarity and reliability
 - Document any ambiguous or unclear elements""",
-                output_format="""<sketch_analysis>
+            output_format="""<sketch_analysis>
 <vehicle_positions>
 Vehicle A: [position description]
 Vehicle B: [position description]
@@ -97,24 +101,24 @@ Overall clarity: [Clear | Moderate | Poor]
 Ambiguous elements: [list any unclear aspects]
 </sketch_clarity>
 </sketch_analysis>""",
-                validation_criteria=[
-                    "Vehicle positions clearly described",
-                    "Movement directions identified", 
-                    "Road layout documented",
-                    "Sketch clarity assessed"
-                ],
-                dependencies=[1]
+            validation_criteria=(
+                "Vehicle positions clearly described",
+                "Movement directions identified", 
+                "Road layout documented",
+                "Sketch clarity assessed"
             ),
-            
-            InstructionStep(
-                step_number=3,
-                step_type=AnalysisStep.INTERPRETATION,
-                instruction="""Interpret the checkbox selections in context:
+            dependencies=(1,)
+        ),
+        
+        InstructionStep(
+            step_number=3,
+            step_type=AnalysisStep.INTERPRETATION,
+            instruction="""Interpret the checkbox selections in context:
 - Map each marked checkbox to its corresponding traffic scenario
 - Identify which checkboxes indicate traffic violations
 - Consider the sequence of events based on checkbox patterns
 - Note any contradictory or inconsistent markings""",
-                output_format="""<checkbox_interpretation>
+            output_format="""<checkbox_interpretation>
 Vehicle A Violations:
 [List specific violations with checkbox numbers]
 
@@ -127,24 +131,24 @@ Traffic Law Analysis:
 Consistency Check:
 [Any contradictions or unusual patterns]
 </checkbox_interpretation>""",
-                validation_criteria=[
-                    "All marked checkboxes interpreted",
-                    "Traffic violations identified",
-                    "Legal significance explained",
-                    "Inconsistencies noted"
-                ],
-                dependencies=[1]
+            validation_criteria=(
+                "All marked checkboxes interpreted",
+                "Traffic violations identified",
+                "Legal significance explained",
+                "Inconsistencies noted"
             ),
-            
-            InstructionStep(
-                step_number=4,
-                step_type=AnalysisStep.CROSS_REFERENCE,
-                instruction="""Cross-reference form data with sketch evidence:
+            dependencies=(1,)
+        ),
+        
+        InstructionStep(
+            step_number=4,
+            step_type=AnalysisStep.CROSS_REFERENCE,
+            instruction="""Cross-reference form data with sketch evidence:
 - Compare checkbox violations with sketch scenario
 - Verify that visual evidence supports form data
 - Identify any discrepancies between sources
 - Assess overall evidence consistency""",
-                output_format="""<evidence_correlation>
+            output_format="""<evidence_correlation>
 <consistency_analysis>
 Form vs Sketch alignment: [description]
 Supporting evidence: [what aligns]
@@ -157,24 +161,24 @@ Confidence factors: [what supports high confidence]
 Uncertainty factors: [what creates doubt]
 </evidence_strength>
 </evidence_correlation>""",
-                validation_criteria=[
-                    "Form and sketch data compared",
-                    "Consistencies and discrepancies identified",
-                    "Evidence strength assessed",
-                    "Confidence factors evaluated"
-                ],
-                dependencies=[2, 3]
+            validation_criteria=(
+                "Form and sketch data compared",
+                "Consistencies and discrepancies identified",
+                "Evidence strength assessed",
+                "Confidence factors evaluated"
             ),
-            
-            InstructionStep(
-                step_number=5,
-                step_type=AnalysisStep.CONCLUSION,
-                instruction="""Make final fault determination based on systematic analysis:
+            dependencies=(2, 3)
+        ),
+        
+        InstructionStep(
+            step_number=5,
+            step_type=AnalysisStep.CONCLUSION,
+            instruction="""Make final fault determination based on systematic analysis:
 - Review all evidence from previous steps
 - Apply traffic law principles to identified violations
 - Determine fault only if confidence level is 80% or higher
 - Provide clear reasoning chain referencing specific evidence""",
-                output_format="""<final_determination>
+            output_format="""<final_determination>
 <fault_assessment>
 Primary fault: [Vehicle A | Vehicle B | Shared | Insufficient evidence]
 Confidence level: [percentage]
@@ -192,67 +196,45 @@ Analysis thoroughness: [self-check]
 Confidence justification: [why this confidence level]
 </quality_validation>
 </final_determination>""",
-                validation_criteria=[
-                    "Decision based on prior analysis steps",
-                    "Confidence level justified",
-                    "Reasoning chain clear and complete",
-                    "Self-validation performed"
-                ],
-                dependencies=[1, 2, 3, 4]
-            )
-        ]
-        
-        return {"insurance_analysis": insurance_steps}
-    
-    def _create_complete_examples(self) -> Dict[str, Dict]:
-        """Create complete systematic analysis prompts"""
-        
-        return {
-            "version_4_systematic": {
-                "description": "Systematic step-by-step insurance analysis",
-                "system_prompt": self._build_systematic_system_prompt(),
-                "user_prompt": self._build_systematic_user_prompt(),
-                "key_improvements": [
-                    "Explicit step-by-step process",
-                    "Required output formats for each step", 
-                    "Validation criteria and dependencies",
-                    "Systematic evidence building",
-                    "Quality self-checking"
-                ]
-            }
-        }
+            validation_criteria=(
+                "Decision based on prior analysis steps",
+                "Confidence level justified",
+                "Reasoning chain clear and complete",
+                "Self-validation performed"
+            ),
+            dependencies=(1, 2, 3, 4)
+        )
+    ]
+
+
+def _build_systematic_prompt(steps: List[InstructionStep]) -> str:
+    """Build the systematic analysis system prompt for a step sequence"""
     
-    def _build_systematic_system_prompt(self) -> str:
-        """Build systematic analysis system prompt"""
-        
-        steps = self.analysis_steps["insurance_analysis"]
-        
-        prompt = """You are an AI assistant helping insurance claims adjusters analyze car accident reports through systematic analysis.
+    parts: List[str] = ["""You are an AI assistant helping insurance claims adjusters analyze car accident reports through systematic analysis.
 
 <analysis_methodology>
 You must follow this exact step-by-step process for every analysis:
 
-"""
+"""]
+    
+    for step in steps:
+        parts.extend([
+            f"Step {step.step_number}: {step.step_type}",
+            step.instruction,
+            "",
+            "Required Output Format:",
+            step.output_format,
+            "",
+            "Validation Criteria:",
+            *(f"- {criteria}" for criteria in step.validation_criteria)
+        ])
         
-        for step in steps:
-            prompt += f"""
-Step {step.step_number}: {step.step_type.value.title()}
-{step.instruction}
-
-Required Output Format:
-{step.output_format}
-
-Validation Criteria:
-{chr(10).join(f"- {criteria}" for criteria in step.validation_criteria)}
-"""
-            
-            if step.dependencies:
-                prompt += f"Dependencies: Complete steps {', '.join(map(str, step.dependencies))} first\n"
-            
-            prompt += "\n" + "-" * 50 + "\n"
+        if step.dependencies:
+            parts.append(f"Dependencies: Complete steps {', '.join(map(str, step.dependencies))} first")
         
-        prompt += """
-</analysis_methodology>
+        parts.extend(["", "-" * 50, ""])
+    
+    parts.append("""</analysis_methodology>
 
 <quality_requirements>
 - Complete ALL steps in order before making final determination
@@ -267,9 +249,100 @@ Validation Criteria:
 - Describe visual evidence from sketches in detail
 - Explain the legal significance of identified violations
 - Show clear reasoning chains connecting evidence to conclusions
-</evidence_standards>"""
+</evidence_standards>""")
+    
+    return "\n".join(parts)
+
+
+def _check_step_dependencies(steps: List[InstructionStep]) -> Dict[str, Any]:
+    """Check that every step only depends on steps that come before it"""
+    
+    validation_results = {
+        "valid": True,
+        "issues": [],
+        "dependency_map": {}
+    }
+    
+    for step in steps:
+        if step.dependencies:
+            for dep in step.dependencies:
+                if dep >= step.step_number:
+                    validation_results["valid"] = False
+                    validation_results["issues"].append(
+                        f"Step {step.step_number} depends on step {dep} which comes after it"
+                    )
+                
+            validation_results["dependency_map"][step.step_number] = step.dependencies
+    
+    return validation_results
+
+
+def _build_step_checklist(steps: List[InstructionStep]) -> Tuple[str, ...]:
+    """Build the analysis checklist for a step sequence"""
+    return tuple(line for step in steps for line in (step.header, *step.criteria_lines))
+
+
+# All of these depend only on static data, so they are built once at import and shared
+_INSURANCE_STEPS = _build_insurance_steps()
+_SYSTEMATIC_SYSTEM_PROMPT = _build_systematic_prompt(_INSURANCE_STEPS)
+_INSURANCE_DEPENDENCIES = _check_step_dependencies(_INSURANCE_STEPS)
+_INSURANCE_CHECKLIST = _build_step_checklist(_INSURANCE_STEPS)
+
+# A misordered step sequence is a bug in this module, so fail at import
+if not _INSURANCE_DEPENDENCIES["valid"]:
+    raise ValueError("; ".join(_INSURANCE_DEPENDENCIES["issues"]))
+
+
+class SystematicAnalysisFramework:
+    """Framework for creating systematic analysis instructions"""
+    
+    def __init__(self):
+        self.analysis_steps = self._create_analysis_steps()
+        self._dependency_validations = self._create_dependency_validations()
+        self._checklists = self._create_checklists()
+        self.complete_examples = self._create_complete_examples()
+    
+    def _create_analysis_steps(self) -> Dict[str, List[InstructionStep]]:
+        """Create systematic analysis step sequences"""
+        return {"insurance_analysis": _INSURANCE_STEPS}
+    
+    def _create_dependency_validations(self) -> Dict[str, Dict[str, Any]]:
+        """Dependency validation results for each step sequence"""
+        return {"insurance_analysis": _INSURANCE_DEPENDENCIES}
+    
+    def _create_checklists(self) -> Dict[str, Tuple[str, ...]]:
+        """Analysis checklists for each step sequence"""
+        return {"insurance_analysis": _INSURANCE_CHECKLIST}
+    
+    def _create_complete_examples(self) -> Dict[str, Dict]:
+        """Create complete systematic analysis prompts"""
         
-        return prompt
+        return {
+            "version_4_systematic": {
+                "description": "Systematic step-by-step insurance analysis",
+                "system_prompt": self._build_systematic_system_prompt(),
+                "user_prompt": self._build_systematic_user_prompt(),
+                "key_improvements": [
+                    "Explicit step-by-step process",
+                    "Required output formats for each step", 
+                    "Validation criteria and dependencies",
+                    "Systematic evidence building",
+                    "Quality self-checking"
+                ]
+            }
+        }
+    
+    def _build_systematic_system_prompt(self) -> str:
+        """Build systematic analysis system prompt"""
+        return _SYSTEMATIC_SYSTEM_PROMPT
+    
+    def get_cached_system_prompt(self) -> List[Dict[str, Any]]:
+        """System prompt as a content block marked for prompt caching"""
+        return [{
+            "type": "text",
+            "text": _SYSTEMATIC_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
     
     def _build_systematic_user_prompt(self) -> str:
         """Build systematic analysis user prompt"""
@@ -294,49 +367,27 @@ Use the specified output formats for each step and complete all validation crite
     def validate_step_dependencies(self, sequence_name: str) -> Dict[str, Any]:
         """Validate that step dependencies are properly ordered"""
         
-        steps = self.analysis_steps.get(sequence_name)
-        if not steps:
+        # Validated once per sequence at construction; see _check_step_dependencies
+        validation_results = self._dependency_validations.get(sequence_name)
+        if not validation_results:
             return {"error": "Sequence not found"}
         
-        validation_results = {
-            "valid": True,
-            "issues": [],
-            "dependency_map": {}
-        }
-        
-        for step in steps:
-            if step.dependencies:
-                for dep in step.dependencies:
-                    if dep >= step.step_number:
-                        validation_results["valid"] = False
-                        validation_results["issues"].append(
-                            f"Step {step.step_number} depends on step {dep} which comes after it"
-                        )
-                    
-                validation_results["dependency_map"][step.step_number] = step.dependencies
-        
-        return validation_results
+        # A copy, so callers editing the result never change the stored validation
+        return copy.deepcopy(validation_results)
     
-    def generate_step_checklist(self, sequence_name: str) -> List[str]:
+    def generate_step_checklist(self, sequence_name: str) -> Tuple[str, ...]:
         """Generate a checklist for systematic analysis"""
-        
-        steps = self.analysis_steps.get(sequence_name)
-        if not steps:
-            return []
-        
-        checklist = []
-        for step in steps:
-            checklist.append(f"☐ Step {step.step_number}: {step.step_type.value.title()}")
-            for criteria in step.validation_criteria:
-                checklist.append(f"  ☐ {criteria}")
-        
-        return checklist
+        return self._checklists.get(sequence_name, ())
+
+
+# Shared instance for callers that don't need their own framework
+FRAMEWORK: Final[SystematicAnalysisFramework] = SystematicAnalysisFramework()
 
 
 def demonstrate_systematic_analysis():
     """Demonstrate systematic analysis framework"""
     
-    framework = SystematicAnalysisFramework()
+    framework = FRAMEWORK
     
     print("=== Systematic Analysis Framework ===\n")
     
@@ -344,8 +395,8 @@ def demonstrate_systematic_analysis():
     insurance_steps = framework.get_step_sequence("insurance_analysis")
     print("## Insurance Analysis Step Sequence:")
     for step in insurance_steps:
-        print(f"\nStep {step.step_number}: {step.step_type.value.title()}")
-        print(f"Dependencies: {step.dependencies if step.dependencies else 'None'}")
+        print(f"\nStep {step.step_number}: {step.step_type}")
+        print(f"Dependencies: {', '.join(map(str, step.dependencies)) or 'None'}")
         print(f"Validation Criteria: {len(step.validation_criteria)} items")
     
     # Validate dependencies
@@ -6,38 +6,55 @@ This module demonstrates how to add task context and tone guidelines
 to create confident, professional AI assistants.
 """
 
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+import io
+import sys
+from typing import Dict, List, Optional, Union, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 
 
-class ConfidenceLevel(Enum):
+class ConfidenceLevel(str, Enum):
     """Confidence level requirements"""
     VERY_HIGH = "95%+"
     HIGH = "80-95%"
     MODERATE = "60-80%"
     LOW = "Below 60%"
+    
+    # Members interpolate into prompts as their plain value
+    __str__ = str.__str__
 
 
-class ToneStyle(Enum):
+class ToneStyle(str, Enum):
     """Different tone styles for different use cases"""
     PROFESSIONAL = "professional"
     TECHNICAL = "technical"
     EXPLANATORY = "explanatory"
     CONCISE = "concise"
+    
+    __str__ = str.__str__
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskContext:
     """Structured task context definition"""
     role: str
     domain: str
-    objectives: List[str]
-    scope_boundaries: List[str]
-    success_criteria: List[str]
+    objectives: Tuple[str, ...]
+    scope_boundaries: Tuple[str, ...]
+    success_criteria: Tuple[str, ...]
+    objectives_bullets: str = field(init=False, repr=False, compare=False)
+    boundaries_bullets: str = field(init=False, repr=False, compare=False)
+    criteria_bullets: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Bullet blocks are rendered once; frozen, so set through object.__setattr__
+        object.__setattr__(self, "objectives_bullets", "\n".join("- " + o for o in self.objectives))
+        object.__setattr__(self, "boundaries_bullets", "\n".join("- " + b for b in self.scope_boundaries))
+        object.__setattr__(self, "criteria_bullets", "\n".join("- " + c for c in self.success_criteria))
 
 
-@dataclass
+@dataclass(slots=True)
 class ToneGuidelines:
     """Tone and behavior guidelines"""
     confidence_threshold: ConfidenceLevel
@@ -47,6 +64,170 @@ class ToneGuidelines:
     evidence_requirements: str
 
 
+def _create_task_contexts() -> Dict[str, TaskContext]:
+    """Create different task context examples"""
+    
+    return {
+        "insurance_adjuster": TaskContext(
+            role="AI assistant helping a human claims adjuster",
+            domain="Swedish car accident report analysis",
+            objectives=(
+                "Analyze standardized accident report forms",
+                "Interpret hand-drawn sketches",
+                "Determine fault based on traffic violations",
+                "Provide evidence-based assessments"
+            ),
+            scope_boundaries=(
+                "Only analyze provided forms and sketches",
+                "Do not make assumptions beyond available data",
+                "Focus on traffic law violations, not insurance policy details",
+                "Do not provide legal advice"
+            ),
+            success_criteria=(
+                "Correct identification of vehicle violations",
+                "Accurate interpretation of visual evidence",
+                "Clear fault determination when evidence supports it",
+                "Appropriate uncertainty acknowledgment"
+            )
+        ),
+        
+        "legal_reviewer": TaskContext(
+            role="AI assistant supporting legal document review",
+            domain="Contract and legal document analysis",
+            objectives=(
+                "Identify key legal clauses and terms",
+                "Flag potential risks or ambiguities",
+                "Summarize important sections",
+                "Suggest areas requiring human review"
+            ),
+            scope_boundaries=(
+                "Assist only, never replace human legal judgment",
+                "Flag issues but don't provide legal advice",
+                "Focus on document content, not legal strategy"
+            ),
+            success_criteria=(
+                "Accurate identification of key terms",
+                "Proper flagging of ambiguous language",
+                "Clear summarization without interpretation"
+            )
+        )
+    }
+
+
+def _create_tone_guidelines() -> Dict[str, ToneGuidelines]:
+    """Create different tone guideline sets"""
+    
+    return {
+        "high_confidence_required": ToneGuidelines(
+            confidence_threshold=ConfidenceLevel.VERY_HIGH,
+            communication_style=ToneStyle.PROFESSIONAL,
+            error_handling="Explicitly state when data is unclear or insufficient",
+            uncertainty_response="Acknowledge uncertainty and explain what additional data would help",
+            evidence_requirements="Always reference specific evidence from source documents"
+        ),
+        
+        "moderate_confidence_acceptable": ToneGuidelines(
+            confidence_threshold=ConfidenceLevel.MODERATE,
+            communication_style=ToneStyle.EXPLANATORY,
+            error_handling="Provide best assessment with confidence level",
+            uncertainty_response="Give preliminary assessment with caveats",
+            evidence_requirements="Reference available evidence and note limitations"
+        ),
+        
+        "technical_analysis": ToneGuidelines(
+            confidence_threshold=ConfidenceLevel.HIGH,
+            communication_style=ToneStyle.TECHNICAL,
+            error_handling="Provide technical details about limitations",
+            uncertainty_response="Quantify uncertainty and suggest additional analysis",
+            evidence_requirements="Detailed citation of all relevant data points"
+        )
+    }
+
+
+# Contexts and guidelines are static configuration shared by every instance
+_TASK_CONTEXTS = _create_task_contexts()
+_TONE_GUIDELINES = _create_tone_guidelines()
+
+
+def _build_insurance_system_prompt() -> str:
+    """Build the insurance analysis system prompt"""
+    
+    task_context = _TASK_CONTEXTS["insurance_adjuster"]
+    tone_guidelines = _TONE_GUIDELINES["high_confidence_required"]
+    
+    return f"""You are an {task_context.role} who is reviewing car accident report forms in Swedish.
+
+<role_definition>
+Domain: {task_context.domain}
+
+Your role is to:
+{task_context.objectives_bullets}
+</role_definition>
+
+<scope_boundaries>
+{task_context.boundaries_bullets}
+</scope_boundaries>
+
+<tone_and_behavior_guidelines>
+Confidence Requirements:
+- Only make fault determinations when you have {tone_guidelines.confidence_threshold} confidence
+- {tone_guidelines.error_handling}
+- {tone_guidelines.uncertainty_response}
+
+Communication Style: {tone_guidelines.communication_style}
+- Stay factual and professional in your assessments
+- {tone_guidelines.evidence_requirements}
+- Use clear, structured reasoning
+
+Error Handling:
+- If you cannot understand what you're looking at, do not guess
+- If the data is unclear or ambiguous, explicitly state this
+- Provide confidence levels for your assessments
+</tone_and_behavior_guidelines>
+
+<success_criteria>
+Your analysis will be considered successful when you:
+{task_context.criteria_bullets}
+</success_criteria>"""
+
+
+def _build_legal_system_prompt() -> str:
+    """Build the legal document review system prompt"""
+    
+    task_context = _TASK_CONTEXTS["legal_reviewer"]
+    tone_guidelines = _TONE_GUIDELINES["moderate_confidence_acceptable"]
+    
+    return f"""You are an {task_context.role}.
+
+<role_definition>
+Domain: {task_context.domain}
+
+Your role is to:
+{task_context.objectives_bullets}
+</role_definition>
+
+<scope_boundaries>
+{task_context.boundaries_bullets}
+</scope_boundaries>
+
+<tone_and_behavior_guidelines>
+Communication Style: {tone_guidelines.communication_style}
+- Provide clear, detailed explanations of findings
+- {tone_guidelines.evidence_requirements}
+- Maintain appropriate professional boundaries
+
+Confidence and Error Handling:
+- {tone_guidelines.error_handling}
+- {tone_guidelines.uncertainty_response}
+- Flag areas requiring human legal expertise
+</tone_and_behavior_guidelines>"""
+
+
+# Every input is static configuration, so both prompts are rendered once at import
+INSURANCE_SYSTEM_PROMPT = _build_insurance_system_prompt()
+LEGAL_SYSTEM_PROMPT = _build_legal_system_prompt()
+
+
 class TaskAndToneExamples:
     """Examples demonstrating task context and tone implementation"""
     
@@ -57,81 +238,11 @@ class TaskAndToneExamples:
     
     def _create_task_contexts(self) -> Dict[str, TaskContext]:
         """Create different task context examples"""
-        
-        return {
-            "insurance_adjuster": TaskContext(
-                role="AI assistant helping a human claims adjuster",
-                domain="Swedish car accident report analysis",
-                objectives=[
-                    "Analyze standardized accident report forms",
-                    "Interpret hand-drawn sketches",
-                    "Determine fault based on traffic violations",
-                    "Provide evidence-based assessments"
-                ],
-                scope_boundaries=[
-                    "Only analyze provided forms and sketches",
-                    "Do not make assumptions beyond available data",
-                    "Focus on traffic law violations, not insurance policy details",
-                    "Do not provide legal advice"
-                ],
-                success_criteria=[
-                    "Correct identification of vehicle violations",
-                    "Accurate interpretation of visual evidence",
-                    "Clear fault determination when evidence supports it",
-                    "Appropriate uncertainty acknowledgment"
-                ]
-            ),
-            
-            "legal_reviewer": TaskContext(
-                role="AI assistant supporting legal document review",
-                domain="Contract and legal document analysis",
-                objectives=[
-                    "Identify key legal clauses and terms",
-                    "Flag potential risks or ambiguities",
-                    "Summarize important sections",
-                    "Suggest areas requiring human review"
-                ],
-                scope_boundaries=[
-                    "Assist only, never replace human legal judgment",
-                    "Flag issues but don't provide legal advice",
-                    "Focus on document content, not legal strategy"
-                ],
-                success_criteria=[
-                    "Accurate identification of key terms",
-                    "Proper flagging of ambiguous language",
-                    "Clear summarization without interpretation"
-                ]
-            )
-        }
+        return _TASK_CONTEXTS
     
     def _create_tone_guidelines(self) -> Dict[str, ToneGuidelines]:
         """Create different tone guideline sets"""
-        
-        return {
-            "high_confidence_required": ToneGuidelines(
-                confidence_threshold=ConfidenceLevel.VERY_HIGH,
-                communication_style=ToneStyle.PROFESSIONAL,
-                error_handling="Explicitly state when data is unclear or insufficient",
-                uncertainty_response="Acknowledge uncertainty and explain what additional data would help",
-                evidence_requirements="Always reference specific evidence from source documents"
-            ),
-            
-            "moderate_confidence_acceptable": ToneGuidelines(
-                confidence_threshold=ConfidenceLevel.MODERATE,
-                communication_style=ToneStyle.EXPLANATORY,
-                error_handling="Provide best assessment with confidence level",
-                uncertainty_response="Give preliminary assessment with caveats",
-                evidence_requirements="Reference available evidence and note limitations"
-            ),
-            
-            "technical_analysis": ToneGuidelines(
-                confidence_threshold=ConfidenceLevel.HIGH,
-                communication_style=ToneStyle.TECHNICAL,
-                error_handling="Provide technical details about limitations",
-                uncertainty_response="Quantify uncertainty and suggest additional analysis",
-                evidence_requirements="Detailed citation of all relevant data points"
-            )
-        }
+        return _TONE_GUIDELINES
     
     def _create_complete_examples(self) -> Dict[str, Dict]:
         """Create complete prompt examples with task and tone"""
@@ -139,7 +250,7 @@ class TaskAndToneExamples:
         return {
             "version_3_insurance": {
                 "description": "Swedish insurance analysis with high confidence requirements",
-                "system_prompt": self._build_insurance_system_prompt(),
+                "system_prompt": INSURANCE_SYSTEM_PROMPT,
                 "user_prompt": self._build_insurance_user_prompt(),
                 "expected_improvements": [
                     "Correctly identifies car accident domain",
@@ -151,7 +262,7 @@ class TaskAndToneExamples:
             
             "version_3_legal": {
                 "description": "Legal document review with moderate confidence",
-                "system_prompt": self._build_legal_system_prompt(),
+                "system_prompt": LEGAL_SYSTEM_PROMPT,
                 "user_prompt": self._build_legal_user_prompt(),
                 "expected_improvements": [
                     "Identifies key legal concepts",
@@ -163,44 +274,7 @@ class TaskAndToneExamples:
     
     def _build_insurance_system_prompt(self) -> str:
         """Build the insurance analysis system prompt"""
-        
-        task_context = self.task_contexts["insurance_adjuster"]
-        tone_guidelines = self.tone_guidelines["high_confidence_required"]
-        
-        return f"""You are an {task_context.role} who is reviewing car accident report forms in Swedish.
-
-<role_definition>
-Domain: {task_context.domain}
-
-Your role is to:
-{chr(10).join(f"- {obj}" for obj in task_context.objectives)}
-</role_definition>
-
-<scope_boundaries>
-{chr(10).join(f"- {boundary}" for boundary in task_context.scope_boundaries)}
-</scope_boundaries>
-
-<tone_and_behavior_guidelines>
-Confidence Requirements:
-- Only make fault determinations when you have {tone_guidelines.confidence_threshold.value} confidence
-- {tone_guidelines.error_handling}
-- {tone_guidelines.uncertainty_response}
-
-Communication Style: {tone_guidelines.communication_style.value}
-- Stay factual and professional in your assessments
-- {tone_guidelines.evidence_requirements}
-- Use clear, structured reasoning
-
-Error Handling:
-- If you cannot understand what you're looking at, do not guess
-- If the data is unclear or ambiguous, explicitly state this
-- Provide confidence levels for your assessments
-</tone_and_behavior_guidelines>
-
-<success_criteria>
-Your analysis will be considered successful when you:
-{chr(10).join(f"- {criteria}" for criteria in task_context.success_criteria)}
-</success_criteria>"""
+        return INSURANCE_SYSTEM_PROMPT
     
     def _build_insurance_user_prompt(self) -> str:
         """Build the insurance analysis user prompt"""
@@ -224,34 +298,7 @@ Provide your complete analysis with clear fault determination and confidence ass
     
     def _build_legal_system_prompt(self) -> str:
         """Build the legal document review system prompt"""
-        
-        task_context = self.task_contexts["legal_reviewer"]
-        tone_guidelines = self.tone_guidelines["moderate_confidence_acceptable"]
-        
-        return f"""You are an {task_context.role}.
-
-<role_definition>
-Domain: {task_context.domain}
-
-Your role is to:
-{chr(10).join(f"- {obj}" for obj in task_context.objectives)}
-</role_definition>
-
-<scope_boundaries>
-{chr(10).join(f"- {boundary}" for boundary in task_context.scope_boundaries)}
-</scope_boundaries>
-
-<tone_and_behavior_guidelines>
-Communication Style: {tone_guidelines.communication_style.value}
-- Provide clear, detailed explanations of findings
-- {tone_guidelines.evidence_requirements}
-- Maintain appropriate professional boundaries
-
-Confidence and Error Handling:
-- {tone_guidelines.error_handling}
-- {tone_guidelines.uncertainty_response}
-- Flag areas requiring human legal expertise
-</tone_and_behavior_guidelines>"""
+        return LEGAL_SYSTEM_PROMPT
     
     def _build_legal_user_prompt(self) -> str:
         """Build the legal document user prompt"""
@@ -292,41 +339,52 @@ Focus on factual analysis rather than legal advice.
         }
 
 
+@lru_cache(maxsize=None)
+def get_examples() -> TaskAndToneExamples:
+    """Shared TaskAndToneExamples instance, created on first use"""
+    return TaskAndToneExamples()
+
+
 def demonstrate_task_and_tone():
     """Demonstrate the impact of task and tone context"""
     
-    examples = TaskAndToneExamples()
+    examples = get_examples()
     
-    print("=== Task and Tone Context Demonstration ===\n")
+    # Collect the report and write it in one call rather than one write per line
+    out = io.StringIO()
+    
+    print("=== Task and Tone Context Demonstration ===\n", file=out)
     
     # Show task contexts
-    print("## Available Task Contexts:")
+    print("## Available Task Contexts:", file=out)
     for name, context in examples.task_contexts.items():
-        print(f"\n### {name}")
-        print(f"Role: {context.role}")
-        print(f"Domain: {context.domain}")
-        print(f"Objectives: {len(context.objectives)} defined")
-        print(f"Boundaries: {len(context.scope_boundaries)} specified")
+        print(f"\n### {name}", file=out)
+        print(f"Role: {context.role}", file=out)
+        print(f"Domain: {context.domain}", file=out)
+        print(f"Objectives: {len(context.objectives)} defined", file=out)
+        print(f"Boundaries: {len(context.scope_boundaries)} specified", file=out)
     
     # Show tone guidelines
-    print("\n## Available Tone Guidelines:")
+    print("\n## Available Tone Guidelines:", file=out)
     for name, tone in examples.tone_guidelines.items():
-        print(f"\n### {name}")
-        print(f"Confidence Threshold: {tone.confidence_threshold.value}")
-        print(f"Style: {tone.communication_style.value}")
-        print(f"Error Handling: {tone.error_handling}")
+        print(f"\n### {name}", file=out)
+        print(f"Confidence Threshold: {tone.confidence_threshold}", file=out)
+        print(f"Style: {tone.communication_style}", file=out)
+        print(f"Error Handling: {tone.error_handling}", file=out)
     
     # Show complete example
     insurance_example = examples.get_example("version_3_insurance")
-    print(f"\n## Complete Example - Insurance Analysis")
-    print(f"System Prompt Length: {len(insurance_example['system_prompt'])} characters")
-    print(f"Expected Improvements: {len(insurance_example['expected_improvements'])} areas")
+    print(f"\n## Complete Example - Insurance Analysis", file=out)
+    print(f"System Prompt Length: {len(insurance_example['system_prompt'])} characters", file=out)
+    print(f"Expected Improvements: {len(insurance_example['expected_improvements'])} areas", file=out)
     
     # Show comparison
     comparison = examples.compare_with_basic("version_3_insurance")
-    print(f"\n## Improvements Over Basic Prompt:")
+    print(f"\n## Improvements Over Basic Prompt:", file=out)
     for improvement in comparison["improvements_added"]:
-        print(f"- {improvement}")
+        print(f"- {improvement}", file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
@@ -5,72 +5,106 @@ Claude Code Prompting 101
 Interactive exercises to practice fundamental prompt engineering concepts.
 """
 
-import json
+import sys
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
-class ExerciseLevel(Enum):
+@lru_cache(maxsize=None)
+def _feedback_encoder():
+    """Shared encoder for feedback printouts, created on first use"""
+    # json is only needed by the interactive session, so importing it is deferred
+    import json
+    return json.JSONEncoder(indent=2)
+
+
+class ExerciseLevel(str, Enum):
     """Exercise difficulty levels"""
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate" 
     ADVANCED = "advanced"
+    
+    # Format as the bare value on every Python version
+    __str__ = str.__str__
 
 
-class AssessmentCriteria(Enum):
+class AssessmentCriteria(str, Enum):
     """Assessment criteria for exercises"""
     CLARITY = "clarity"
     COMPLETENESS = "completeness"
     STRUCTURE = "structure"
     PRACTICALITY = "practicality"
+    
+    __str__ = str.__str__
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Exercise:
     """Individual exercise definition"""
     id: str
     title: str
     level: ExerciseLevel
-    objectives: List[str]
+    objectives: Tuple[str, ...]
     description: str
     sample_scenario: str
-    success_criteria: List[str]
+    success_criteria: Tuple[str, ...]
     time_estimate: int  # minutes
-    assessment_rubric: Dict[AssessmentCriteria, str]
+    assessment_rubric: Tuple[Tuple[AssessmentCriteria, str], ...]  # (criteria, description) pairs
+    objectives_bullets: str = field(init=False, repr=False, compare=False)
+    criteria_bullets: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Bullet blocks are rendered once; frozen, so set through object.__setattr__
+        object.__setattr__(self, "objectives_bullets", "\n".join("- " + o for o in self.objectives))
+        object.__setattr__(self, "criteria_bullets", "\n".join("- " + c for c in self.success_criteria))
 
 
-@dataclass
+@dataclass(slots=True)
 class ExerciseSubmission:
     """Student exercise submission"""
     exercise_id: str
     student_response: str
-    timestamp: str
+    timestamp: float  # seconds since the epoch
     self_assessment: Dict[str, int]  # 1-5 scale
+    
+    @property
+    def timestamp_str(self) -> str:
+        """Local submission time, formatted only when it is read"""
+        return datetime.fromtimestamp(self.timestamp).isoformat(sep=" ", timespec="seconds")
 
 
-class Chapter1Exercises:
-    """Chapter 1 exercise collection and management"""
+def _missing_keywords(response: str, required: Tuple[Tuple[str, str], ...]) -> List[str]:
+    """Feedback messages for required keywords the response never mentions"""
     
-    def __init__(self):
-        self.exercises = self._create_exercises()
-        self.submissions = []
+    # Keywords are lowercase, so a direct hit needs no lowercased copy of the response
+    unmatched = [(keyword, message) for keyword, message in required if keyword not in response]
+    if not unmatched:
+        return []
     
-    def _create_exercises(self) -> Dict[str, Exercise]:
-        """Create Chapter 1 exercises"""
-        
-        return {
-            "1.1": Exercise(
-                id="1.1",
-                title="Basic Prompt Construction",
-                level=ExerciseLevel.BEGINNER,
-                objectives=[
-                    "Construct a basic prompt for a specific task",
-                    "Identify the core components of effective prompts",
-                    "Recognize common prompt construction mistakes"
-                ],
-                description="""
+    response_lower = response.lower()
+    return [message for keyword, message in unmatched if keyword not in response_lower]
+
+
+def _build_exercises() -> Dict[str, Exercise]:
+    """Create Chapter 1 exercises"""
+    
+    return {
+        "1.1": Exercise(
+            id="1.1",
+            title="Basic Prompt Construction",
+            level=ExerciseLevel.BEGINNER,
+            objectives=(
+                "Construct a basic prompt for a specific task",
+                "Identify the core components of effective prompts",
+                "Recognize common prompt construction mistakes"
+            ),
+            description="""
 You work for a medical clinic that wants to use AI to help categorize patient symptoms 
 from intake forms. Create a basic prompt that instructs Claude to:
 1. Read patient symptom descriptions
@@ -79,41 +113,41 @@ from intake forms. Create a basic prompt that instructs Claude to:
 
 Write your initial prompt attempt without looking at the course materials.
                 """,
-                sample_scenario="""
+            sample_scenario="""
 Patient intake form:
 "I've been having severe chest pain for the last 2 hours, especially when I breathe. 
 Also experiencing shortness of breath and some nausea. Pain radiates to my left arm."
                 """,
-                success_criteria=[
-                    "Prompt clearly defines the task",
-                    "Instructions are specific enough to guide categorization",
-                    "Includes mechanism for flagging urgent symptoms",
-                    "Can be understood by someone unfamiliar with medical terminology"
-                ],
-                time_estimate=20,
-                assessment_rubric={
-                    AssessmentCriteria.CLARITY: "Instructions are clear and unambiguous",
-                    AssessmentCriteria.COMPLETENESS: "All required components addressed", 
-                    AssessmentCriteria.STRUCTURE: "Logical organization of instructions",
-                    AssessmentCriteria.PRACTICALITY: "Prompt would work in real scenarios"
-                }
+            success_criteria=(
+                "Prompt clearly defines the task",
+                "Instructions are specific enough to guide categorization",
+                "Includes mechanism for flagging urgent symptoms",
+                "Can be understood by someone unfamiliar with medical terminology"
             ),
-            
-            "1.2": Exercise(
-                id="1.2", 
-                title="Problem Identification in Naive Prompts",
-                level=ExerciseLevel.BEGINNER,
-                objectives=[
-                    "Analyze problematic prompts and identify specific issues",
-                    "Understand why vague prompts lead to poor results",
-                    "Practice systematic prompt evaluation"
-                ],
-                description="""
+            time_estimate=20,
+            assessment_rubric=(
+                (AssessmentCriteria.CLARITY, "Instructions are clear and unambiguous"),
+                (AssessmentCriteria.COMPLETENESS, "All required components addressed"), 
+                (AssessmentCriteria.STRUCTURE, "Logical organization of instructions"),
+                (AssessmentCriteria.PRACTICALITY, "Prompt would work in real scenarios")
+            )
+        ),
+        
+        "1.2": Exercise(
+            id="1.2", 
+            title="Problem Identification in Naive Prompts",
+            level=ExerciseLevel.BEGINNER,
+            objectives=(
+                "Analyze problematic prompts and identify specific issues",
+                "Understand why vague prompts lead to poor results",
+                "Practice systematic prompt evaluation"
+            ),
+            description="""
 Analyze the following problematic prompts and identify specific issues with each.
 For each prompt, list 3-5 specific problems and explain why each problem would
 lead to poor or inconsistent results.
                 """,
-                sample_scenario="""
+            sample_scenario="""
 Problematic Prompt #1:
 "Look at this legal document and tell me what it says."
 
@@ -123,31 +157,31 @@ Problematic Prompt #2:
 Problematic Prompt #3:
 "Help me write something professional for work."
                 """,
-                success_criteria=[
-                    "Identifies vagueness and lack of specificity",
-                    "Recognizes missing context and domain information",
-                    "Points out absence of output format requirements",
-                    "Understands how ambiguity leads to inconsistent results"
-                ],
-                time_estimate=15,
-                assessment_rubric={
-                    AssessmentCriteria.CLARITY: "Issues are clearly articulated",
-                    AssessmentCriteria.COMPLETENESS: "Multiple problems identified per prompt",
-                    AssessmentCriteria.STRUCTURE: "Systematic analysis approach",
-                    AssessmentCriteria.PRACTICALITY: "Problems connect to real consequences"
-                }
+            success_criteria=(
+                "Identifies vagueness and lack of specificity",
+                "Recognizes missing context and domain information",
+                "Points out absence of output format requirements",
+                "Understands how ambiguity leads to inconsistent results"
             ),
-            
-            "1.3": Exercise(
-                id="1.3",
-                title="Iterative Improvement Process",
-                level=ExerciseLevel.INTERMEDIATE,
-                objectives=[
-                    "Practice the iterative improvement methodology",
-                    "Document prompt evolution through versions",
-                    "Apply empirical testing approach to prompt development"
-                ],
-                description="""
+            time_estimate=15,
+            assessment_rubric=(
+                (AssessmentCriteria.CLARITY, "Issues are clearly articulated"),
+                (AssessmentCriteria.COMPLETENESS, "Multiple problems identified per prompt"),
+                (AssessmentCriteria.STRUCTURE, "Systematic analysis approach"),
+                (AssessmentCriteria.PRACTICALITY, "Problems connect to real consequences")
+            )
+        ),
+        
+        "1.3": Exercise(
+            id="1.3",
+            title="Iterative Improvement Process",
+            level=ExerciseLevel.INTERMEDIATE,
+            objectives=(
+                "Practice the iterative improvement methodology",
+                "Document prompt evolution through versions",
+                "Apply empirical testing approach to prompt development"
+            ),
+            description="""
 Take your basic prompt from Exercise 1.1 and improve it through 3 iterations.
 For each iteration:
 1. Test the prompt with the provided scenarios
@@ -157,7 +191,7 @@ For each iteration:
 
 Create versions 1.0, 2.0, and 3.0 of your medical symptom categorization prompt.
                 """,
-                sample_scenario="""
+            sample_scenario="""
 Test scenarios:
 1. "Severe chest pain, shortness of breath, arm pain"  
 2. "Mild headache, occasional dizziness, tired lately"
@@ -165,22 +199,50 @@ Test scenarios:
 4. "Rash on arms, itchy, started after new medication"
 5. "Can't sleep, anxious about work, heart racing sometimes"
                 """,
-                success_criteria=[
-                    "Three distinct prompt versions created",
-                    "Each iteration shows specific improvements",
-                    "Problems and solutions clearly documented",
-                    "Final version significantly better than initial",
-                    "Testing results justify changes made"
-                ],
-                time_estimate=45,
-                assessment_rubric={
-                    AssessmentCriteria.CLARITY: "Evolution process clearly documented",
-                    AssessmentCriteria.COMPLETENESS: "All iterations completed with testing",
-                    AssessmentCriteria.STRUCTURE: "Systematic improvement methodology",
-                    AssessmentCriteria.PRACTICALITY: "Improvements address real issues"
-                }
+            success_criteria=(
+                "Three distinct prompt versions created",
+                "Each iteration shows specific improvements",
+                "Problems and solutions clearly documented",
+                "Final version significantly better than initial",
+                "Testing results justify changes made"
+            ),
+            time_estimate=45,
+            assessment_rubric=(
+                (AssessmentCriteria.CLARITY, "Evolution process clearly documented"),
+                (AssessmentCriteria.COMPLETENESS, "All iterations completed with testing"),
+                (AssessmentCriteria.STRUCTURE, "Systematic improvement methodology"),
+                (AssessmentCriteria.PRACTICALITY, "Improvements address real issues")
             )
-        }
+        )
+    }
+
+
+# Exercise definitions are static, so every Chapter1Exercises instance shares one table
+_EXERCISES = _build_exercises()
+
+
+class Chapter1Exercises:
+    """Chapter 1 exercise collection and management"""
+    
+    # Keywords a response must mention, with the feedback given when one is missing
+    REQUIRED_KEYWORDS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+        "1.1": (
+            ("symptom", "Ensure your prompt addresses symptom categorization"),
+            ("urgent", "Include mechanism for flagging urgent symptoms")
+        )
+    }
+    
+    def __init__(self, max_submissions: int = 1000):
+        self.exercises = self._create_exercises()
+        # Recent submissions only; completed_ids is the record of progress
+        self.submissions: Deque[ExerciseSubmission] = deque(maxlen=max_submissions)
+        self.completed_ids: Set[str] = set()
+        self._instructions_cache: Dict[str, str] = {}
+        self._next_steps_by_id = self._build_next_steps()
+    
+    def _create_exercises(self) -> Dict[str, Exercise]:
+        """Create Chapter 1 exercises"""
+        return _EXERCISES
     
     def get_exercise(self, exercise_id: str) -> Optional[Exercise]:
         """Get specific exercise by ID"""
@@ -188,7 +250,7 @@ Test scenarios:
     
     def list_exercises(self) -> List[str]:
         """List all available exercises"""
-        return [f"{ex.id}: {ex.title} ({ex.level.value})" for ex in self.exercises.values()]
+        return [f"{ex.id}: {ex.title} ({ex.level})" for ex in self.exercises.values()]
     
     def start_exercise(self, exercise_id: str) -> Dict:
         """Start an exercise session"""
@@ -199,13 +261,21 @@ Test scenarios:
         return {
             "exercise": exercise,
             "start_time": time.time(),
-            "instructions": f"""
+            "instructions": self._render_instructions(exercise)
+        }
+    
+    def _render_instructions(self, exercise: Exercise) -> str:
+        """Render exercise instructions, cached per exercise since they never change"""
+        
+        instructions = self._instructions_cache.get(exercise.id)
+        if instructions is None:
+            instructions = f"""
 === {exercise.title} ===
-Level: {exercise.level.value.title()}
+Level: {exercise.level.title()}
 Estimated Time: {exercise.time_estimate} minutes
 
 Objectives:
-{chr(10).join(f"- {obj}" for obj in exercise.objectives)}
+{exercise.objectives_bullets}
 
 Description:
 {exercise.description}
@@ -214,11 +284,13 @@ Sample Scenario:
 {exercise.sample_scenario}
 
 Success Criteria:
-{chr(10).join(f"- {criteria}" for criteria in exercise.success_criteria)}
+{exercise.criteria_bullets}
 
 Begin your response below:
             """
-        }
+            self._instructions_cache[exercise.id] = instructions
+        
+        return instructions
     
     def submit_exercise(self, exercise_id: str, response: str, self_assessment: Dict[str, int] = None) -> Dict:
         """Submit exercise response"""
@@ -229,22 +301,27 @@ Begin your response below:
         submission = ExerciseSubmission(
             exercise_id=exercise_id,
             student_response=response,
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=time.time(),
             self_assessment=self_assessment or {}
         )
         
         self.submissions.append(submission)
+        self.completed_ids.add(exercise_id)
         
         # Generate feedback
         feedback = self._generate_feedback(exercise, submission)
         
         return {
             "submission_received": True,
-            "timestamp": submission.timestamp,
+            "timestamp": submission.timestamp_str,
             "feedback": feedback,
             "next_steps": self._get_next_steps(exercise_id)
         }
     
+    def submit_exercise_from_file(self, exercise_id: str, path: str, self_assessment: Dict[str, int] = None) -> Dict:
+        """Submit an exercise response read from a text file"""
+        return self.submit_exercise(exercise_id, Path(path).read_text(encoding="utf-8"), self_assessment)
+    
     def _generate_feedback(self, exercise: Exercise, submission: ExerciseSubmission) -> Dict:
         """Generate feedback for exercise submission"""
         
@@ -264,11 +341,9 @@ Begin your response below:
             feedback["areas_to_review"].append("Consider being more concise and focused")
         
         # Check for key elements based on exercise
-        if exercise.id == "1.1":
-            if "symptom" not in submission.student_response.lower():
-                feedback["areas_to_review"].append("Ensure your prompt addresses symptom categorization")
-            if "urgent" not in submission.student_response.lower():
-                feedback["areas_to_review"].append("Include mechanism for flagging urgent symptoms")
+        required = self.REQUIRED_KEYWORDS.get(exercise.id)
+        if required:
+            feedback["areas_to_review"].extend(_missing_keywords(submission.student_response, required))
         
         # General feedback
         feedback["suggestions"].extend([
@@ -282,30 +357,39 @@ Begin your response below:
     def _get_next_steps(self, completed_exercise_id: str) -> List[str]:
         """Get recommended next steps after completing exercise"""
         
-        exercise_order = ["1.1", "1.2", "1.3"]
-        
-        try:
-            current_index = exercise_order.index(completed_exercise_id)
-            if current_index < len(exercise_order) - 1:
-                next_exercise = exercise_order[current_index + 1]
-                return [
-                    f"Proceed to Exercise {next_exercise}",
-                    "Review your submission against the assessment rubric",
-                    "Compare your approach with provided solutions"
-                ]
-            else:
-                return [
-                    "Complete Chapter 1 assessment quiz",
-                    "Proceed to Chapter 2: Prompt Structure Fundamentals",
-                    "Review all Chapter 1 exercises for patterns"
-                ]
-        except ValueError:
+        next_steps = self._next_steps_by_id.get(completed_exercise_id)
+        if next_steps is None:
             return ["Continue with remaining Chapter 1 exercises"]
+        
+        return list(next_steps)
+    
+    def _build_next_steps(self) -> Dict[str, Tuple[str, ...]]:
+        """Precompute the next-step recommendations for each exercise in order"""
+        
+        exercise_order = list(self.exercises)
+        
+        next_steps = {}
+        for current_id, next_exercise in zip(exercise_order, exercise_order[1:]):
+            next_steps[current_id] = (
+                f"Proceed to Exercise {next_exercise}",
+                "Review your submission against the assessment rubric",
+                "Compare your approach with provided solutions"
+            )
+        
+        next_steps[exercise_order[-1]] = (
+            "Complete Chapter 1 assessment quiz",
+            "Proceed to Chapter 2: Prompt Structure Fundamentals",
+            "Review all Chapter 1 exercises for patterns"
+        )
+        
+        return next_steps
     
     def generate_progress_report(self) -> Dict:
         """Generate progress report for all exercises"""
         
-        completed = [sub.exercise_id for sub in self.submissions]
+        # Resubmissions count once; both lists keep the exercise order
+        completed = [ex_id for ex_id in self.exercises if ex_id in self.completed_ids]
+        remaining = [ex_id for ex_id in self.exercises if ex_id not in self.completed_ids]
         total_exercises = len(self.exercises)
         completion_rate = len(completed) / total_exercises
         
@@ -314,12 +398,8 @@ Begin your response below:
             "completed_exercises": len(completed),
             "completion_rate": f"{completion_rate:.1%}",
             "completed_list": completed,
-            "remaining_exercises": [ex_id for ex_id in self.exercises.keys() if ex_id not in completed],
-            "estimated_time_remaining": sum(
-                self.exercises[ex_id].time_estimate 
-                for ex_id in self.exercises.keys() 
-                if ex_id not in completed
-            )
+            "remaining_exercises": remaining,
+            "estimated_time_remaining": sum(self.exercises[ex_id].time_estimate for ex_id in remaining)
         }
 
 
@@ -353,13 +433,12 @@ def interactive_exercise_session():
             
             print("\nEnter your response (type 'DONE' on a new line when finished):")
             response_lines = []
-            while True:
-                line = input()
+            for line in iter(sys.stdin.readline, ""):
                 if line.strip() == "DONE":
                     break
                 response_lines.append(line)
             
-            response = "\n".join(response_lines)
+            response = "".join(response_lines).removesuffix("\n")
             
             # Optional self-assessment
             print("\nOptional self-assessment (1-5 scale, press Enter to skip):")
@@ -371,7 +450,7 @@ def interactive_exercise_session():
             
             result = exercises.submit_exercise(exercise_id, response, self_assessment)
             print(f"\nSubmission Status: {result['submission_received']}")
-            print(f"Feedback: {json.dumps(result['feedback'], indent=2)}")
+            print(f"Feedback: {_feedback_encoder().encode(result['feedback'])}")
             print(f"Next Steps: {result['next_steps']}")
         
         elif choice == "2":
@@ -7,15 +7,24 @@ Based on the best practices from the Claude Code Prompting 101 tutorial.
 """
 
 import json
-import yaml
 import argparse
+import asyncio
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-from anthropic import Anthropic
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-@dataclass
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+@dataclass(frozen=True, slots=True)
 class PromptComponent:
     """Individual component of a prompt"""
     name: str
@@ -23,8 +32,12 @@ class PromptComponent:
     type: str  # 'system', 'context', 'instruction', 'example', 'constraint'
     required: bool = True
     validation_rules: Optional[List[str]] = None
+    
+    def __post_init__(self):
+        # Types from JSON are fresh strings; interning makes bucket lookups hit on identity
+        object.__setattr__(self, 'type', sys.intern(self.type))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     """Complete prompt template structure"""
     name: str
@@ -35,210 +48,351 @@ class PromptTemplate:
     validation_criteria: List[str]
     expected_output_format: str
     version: str = "1.0"
-    created_date: str = None
+    created_date: Optional[str] = field(default_factory=lambda: datetime.now().isoformat())
+    # Derived from the fields above once, since templates are immutable
+    components_by_type: Dict[str, Tuple[PromptComponent, ...]] = field(init=False, repr=False, compare=False)
+    system_prompt: str = field(init=False, repr=False, compare=False)
+    user_prompt_suffix: str = field(init=False, repr=False, compare=False)
+    criterion_checks: List[Tuple[str, Callable[[str, str], bool]]] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        # Template JSON may carry an explicit null date, which the default factory does not cover
         if self.created_date is None:
-            self.created_date = datetime.now().isoformat()
+            object.__setattr__(self, 'created_date', datetime.now().isoformat())
+        
+        # Components loaded from JSON arrive as plain dicts
+        components = [
+            component if isinstance(component, PromptComponent) else PromptComponent(**component)
+            for component in self.components
+        ]
+        object.__setattr__(self, 'components', components)
+        
+        # Bucket components by type in a single pass
+        buckets = {'system': [], 'context': [], 'instruction': [], 'constraint': []}
+        for component in components:
+            buckets.setdefault(component.type, []).append(component)
+        by_type = {component_type: tuple(bucket) for component_type, bucket in buckets.items()}
+        object.__setattr__(self, 'components_by_type', by_type)
+        object.__setattr__(self, 'system_prompt', _build_system_prompt(
+            by_type['system'], by_type['context'], by_type['instruction'], by_type['constraint']
+        ))
+        
+        # Output format and quality requirement blocks that close every user prompt
+        object.__setattr__(self, 'user_prompt_suffix', "\n".join([
+            "\n<output_format>",
+            "Please provide your analysis in the following format:",
+            self.expected_output_format,
+            "</output_format>",
+            "\n<quality_requirements>",
+            "Ensure your response meets these criteria:",
+            *(f"- {criterion}" for criterion in self.validation_criteria),
+            "</quality_requirements>"
+        ]))
+        
+        # Each validation criterion paired with the response check it maps to
+        object.__setattr__(self, 'criterion_checks', [
+            (criterion, _criterion_check(criterion)) for criterion in self.validation_criteria
+        ])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form of the template; derived prompt fields are rebuilt on load"""
+        return {
+            'name': self.name,
+            'description': self.description,
+            'domain': self.domain,
+            'components': [
+                {
+                    'name': component.name,
+                    'content': component.content,
+                    'type': component.type,
+                    'required': component.required,
+                    'validation_rules': component.validation_rules
+                }
+                for component in self.components
+            ],
+            'variables': self.variables,
+            'validation_criteria': self.validation_criteria,
+            'expected_output_format': self.expected_output_format,
+            'version': self.version,
+            'created_date': self.created_date
+        }
+
+def _build_system_prompt(system_components, context_components, instruction_components, constraint_components) -> str:
+    """Build the system prompt from components"""
+    # Role definition
+    prompt_parts = [component.content for component in system_components]
+    
+    # Context and domain knowledge
+    if context_components:
+        prompt_parts.extend(("\n<context>", *(component.content for component in context_components), "</context>"))
+    
+    # Instructions and methodology
+    if instruction_components:
+        prompt_parts.extend(("\n<methodology>", *(component.content for component in instruction_components), "</methodology>"))
+    
+    # Constraints and limitations
+    if constraint_components:
+        prompt_parts.extend(("\n<constraints>", *(component.content for component in constraint_components), "</constraints>"))
+    
+    return "\n".join(prompt_parts)
+
+# Checks take the response and its lowercased copy, so callers lowercase only once.
+# With this handful of keywords, C-level substring tests beat a single combined regex scan.
+def _mentions_confidence(response: str, response_lower: str) -> bool:
+    return 'confidence' in response_lower or '%' in response
+
+def _mentions_evidence(response: str, response_lower: str) -> bool:
+    return 'evidence' in response_lower or 'section' in response_lower
+
+def _has_markup(response: str, response_lower: str) -> bool:
+    return '<' in response and '>' in response
+
+def _mentions_limitations(response: str, response_lower: str) -> bool:
+    return 'limitation' in response_lower or 'uncertain' in response_lower
+
+def _always_passes(response: str, response_lower: str) -> bool:
+    return True
+
+def _criterion_check(criterion: str) -> Callable[[str, str], bool]:
+    """Pick the response check for a criterion from its keywords"""
+    criterion_lower = criterion.lower()
+    
+    # Basic keyword-based validation (can be enhanced)
+    if 'confidence' in criterion_lower:
+        return _mentions_confidence
+    elif 'evidence' in criterion_lower:
+        return _mentions_evidence
+    elif 'xml' in criterion_lower or 'format' in criterion_lower:
+        return _has_markup
+    elif 'limitation' in criterion_lower:
+        return _mentions_limitations
+    
+    return _always_passes  # Default to pass for unknown criteria
+
+def _create_insurance_template() -> PromptTemplate:
+    """Create the insurance claims analysis template"""
+    return PromptTemplate(
+        name="insurance_claims",
+        description="Comprehensive insurance claims analysis with fault determination",
+        domain="insurance",
+        components=[
+            PromptComponent(
+                name="role_definition",
+                content="You are an AI assistant helping insurance claims adjusters analyze accident reports and determine fault.",
+                type="system",
+                required=True
+            ),
+            PromptComponent(
+                name="domain_knowledge",
+                content="Traffic law principles, right-of-way rules, form interpretation guidelines",
+                type="context",
+                required=True
+            ),
+            PromptComponent(
+                name="methodology",
+                content="4-step systematic analysis: form examination, evidence interpretation, fault determination, recommendations",
+                type="instruction",
+                required=True
+            ),
+            PromptComponent(
+                name="output_format",
+                content="Structured XML output with case_summary, evidence_review, fault_assessment, recommendations",
+                type="constraint",
+                required=True
+            )
+        ],
+        variables={
+            "case_id": "string",
+            "incident_description": "string",
+            "evidence_attachments": "list",
+            "special_instructions": "string"
+        },
+        validation_criteria=[
+            "Includes specific evidence references",
+            "Provides confidence level (0-100%)",
+            "Only makes determinations when >90% confident",
+            "Acknowledges limitations explicitly"
+        ],
+        expected_output_format="XML with required sections: claim_analysis, case_summary, evidence_review, fault_assessment, recommendations"
+    )
+
+def _create_legal_template() -> PromptTemplate:
+    """Create the legal document review template"""
+    return PromptTemplate(
+        name="legal_review",
+        description="Comprehensive legal document analysis and risk assessment",
+        domain="legal",
+        components=[
+            PromptComponent(
+                name="role_definition",
+                content="You are an AI assistant specialized in legal document review and analysis",
+                type="system",
+                required=True
+            ),
+            PromptComponent(
+                name="analysis_framework",
+                content="Document structure, risk assessment, compliance review, negotiation insights",
+                type="instruction",
+                required=True
+            ),
+            PromptComponent(
+                name="limitations",
+                content="Do not provide legal advice, complex matters require attorney review",
+                type="constraint",
+                required=True
+            )
+        ],
+        variables={
+            "document_type": "string",
+            "review_purpose": "string",
+            "specific_concerns": "string",
+            "business_context": "string"
+        },
+        validation_criteria=[
+            "Cites specific clauses and sections",
+            "Provides clear risk ratings (High/Medium/Low)",
+            "Distinguishes legal issues from business preferences",
+            "Recommends attorney review when appropriate"
+        ],
+        expected_output_format="XML with legal_review structure including risk_assessment, compliance_review, recommendations"
+    )
+
+def _create_medical_template() -> PromptTemplate:
+    """Create the medical document analysis template"""
+    return PromptTemplate(
+        name="medical_analysis",
+        description="Medical document analysis for quality assurance and care coordination",
+        domain="medical",
+        components=[
+            PromptComponent(
+                name="role_definition",
+                content="You are an AI assistant specialized in medical document analysis and clinical information processing",
+                type="system",
+                required=True
+            ),
+            PromptComponent(
+                name="hipaa_compliance",
+                content="Maintain strict patient confidentiality, use de-identified references only",
+                type="constraint",
+                required=True
+            ),
+            PromptComponent(
+                name="limitations",
+                content="Do not provide medical advice, focus on documentation and administrative aspects only",
+                type="constraint",
+                required=True
+            )
+        ],
+        variables={
+            "document_type": "string",
+            "analysis_purpose": "string",
+            "clinical_context": "string",
+            "focus_areas": "string"
+        },
+        validation_criteria=[
+            "Maintains HIPAA compliance",
+            "Focuses on documentation quality",
+            "Avoids medical advice",
+            "Recommends clinical review appropriately"
+        ],
+        expected_output_format="XML with medical_analysis structure including clinical_information, documentation_quality, recommendations"
+    )
+
+def _create_general_template() -> PromptTemplate:
+    """Create a general-purpose analysis template"""
+    return PromptTemplate(
+        name="general_analysis",
+        description="General-purpose document analysis and information extraction",
+        domain="general",
+        components=[
+            PromptComponent(
+                name="role_definition",
+                content="You are an AI assistant specialized in document analysis and information extraction",
+                type="system",
+                required=True
+            ),
+            PromptComponent(
+                name="methodology",
+                content="Systematic analysis approach: structure review, content extraction, quality assessment, recommendations",
+                type="instruction",
+                required=True
+            )
+        ],
+        variables={
+            "document_type": "string",
+            "analysis_goals": "string",
+            "output_format": "string",
+            "specific_requirements": "string"
+        },
+        validation_criteria=[
+            "Provides structured output",
+            "Includes confidence assessment",
+            "Acknowledges limitations",
+            "Offers actionable recommendations"
+        ],
+        expected_output_format="Structured format based on requirements, typically XML or JSON"
+    )
+
+# Built-in templates are static, so they are constructed once at import and shared
+_BUILTIN_TEMPLATES: Dict[str, PromptTemplate] = {
+    'insurance_claims': _create_insurance_template(),
+    'legal_review': _create_legal_template(),
+    'medical_analysis': _create_medical_template(),
+    'general_analysis': _create_general_template()
+}
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> 'Anthropic':
+    """Shared client per API key, so builders reuse one connection pool"""
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
 
 class PromptBuilder:
     """Main class for building and managing prompts"""
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.client = Anthropic(api_key=self.api_key) if self.api_key else None
         self.templates: Dict[str, PromptTemplate] = {}
         self.load_templates()
     
+    @property
+    def client(self) -> Optional['Anthropic']:
+        """API client, created on first use so commands that never call the API skip the SDK import"""
+        return _get_client(self.api_key) if self.api_key else None
+    
     def load_templates(self):
         """Load existing prompt templates from templates directory"""
         templates_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
         
         # Load built-in templates
-        builtin_templates = {
-            'insurance_claims': self.create_insurance_template(),
-            'legal_review': self.create_legal_template(),
-            'medical_analysis': self.create_medical_template(),
-            'general_analysis': self.create_general_template()
-        }
-        
-        self.templates.update(builtin_templates)
+        self.templates.update(_BUILTIN_TEMPLATES)
         
         # Load custom templates if they exist
         if os.path.exists(templates_dir):
-            for filename in os.listdir(templates_dir):
-                if filename.endswith('.json'):
-                    try:
-                        with open(os.path.join(templates_dir, filename), 'r') as f:
-                            template_data = json.load(f)
-                            template = PromptTemplate(**template_data)
+            with os.scandir(templates_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        try:
+                            template = PromptTemplate(**_load_json_file(entry.path))
                             self.templates[template.name] = template
-                    except Exception as e:
-                        print(f"Warning: Could not load template {filename}: {e}")
+                        except Exception as e:
+                            print(f"Warning: Could not load template {entry.name}: {e}")
     
     def create_insurance_template(self) -> PromptTemplate:
         """Create the insurance claims analysis template"""
-        return PromptTemplate(
-            name="insurance_claims",
-            description="Comprehensive insurance claims analysis with fault determination",
-            domain="insurance",
-            components=[
-                PromptComponent(
-                    name="role_definition",
-                    content="You are an AI assistant helping insurance claims adjusters analyze accident reports and determine fault.",
-                    type="system",
-                    required=True
-                ),
-                PromptComponent(
-                    name="domain_knowledge",
-                    content="Traffic law principles, right-of-way rules, form interpretation guidelines",
-                    type="context",
-                    required=True
-                ),
-                PromptComponent(
-                    name="methodology",
-                    content="4-step systematic analysis: form examination, evidence interpretation, fault determination, recommendations",
-                    type="instruction",
-                    required=True
-                ),
-                PromptComponent(
-                    name="output_format",
-                    content="Structured XML output with case_summary, evidence_review, fault_assessment, recommendations",
-                    type="constraint",
-                    required=True
-                )
-            ],
-            variables={
-                "case_id": "string",
-                "incident_description": "string",
-                "evidence_attachments": "list",
-                "special_instructions": "string"
-            },
-            validation_criteria=[
-                "Includes specific evidence references",
-                "Provides confidence level (0-100%)",
-                "Only makes determinations when >90% confident",
-                "Acknowledges limitations explicitly"
-            ],
-            expected_output_format="XML with required sections: claim_analysis, case_summary, evidence_review, fault_assessment, recommendations"
-        )
+        return _create_insurance_template()
     
     def create_legal_template(self) -> PromptTemplate:
         """Create the legal document review template"""
-        return PromptTemplate(
-            name="legal_review",
-            description="Comprehensive legal document analysis and risk assessment",
-            domain="legal",
-            components=[
-                PromptComponent(
-                    name="role_definition",
-                    content="You are an AI assistant specialized in legal document review and analysis",
-                    type="system",
-                    required=True
-                ),
-                PromptComponent(
-                    name="analysis_framework",
-                    content="Document structure, risk assessment, compliance review, negotiation insights",
-                    type="instruction",
-                    required=True
-                ),
-                PromptComponent(
-                    name="limitations",
-                    content="Do not provide legal advice, complex matters require attorney review",
-                    type="constraint",
-                    required=True
-                )
-            ],
-            variables={
-                "document_type": "string",
-                "review_purpose": "string",
-                "specific_concerns": "string",
-                "business_context": "string"
-            },
-            validation_criteria=[
-                "Cites specific clauses and sections",
-                "Provides clear risk ratings (High/Medium/Low)",
-                "Distinguishes legal issues from business preferences",
-                "Recommends attorney review when appropriate"
-            ],
-            expected_output_format="XML with legal_review structure including risk_assessment, compliance_review, recommendations"
-        )
+        return _create_legal_template()
     
     def create_medical_template(self) -> PromptTemplate:
         """Create the medical document analysis template"""
-        return PromptTemplate(
-            name="medical_analysis",
-            description="Medical document analysis for quality assurance and care coordination",
-            domain="medical",
-            components=[
-                PromptComponent(
-                    name="role_definition",
-                    content="You are an AI assistant specialized in medical document analysis and clinical information processing",
-                    type="system",
-                    required=True
-                ),
-                PromptComponent(
-                    name="hipaa_compliance",
-                    content="Maintain strict patient confidentiality, use de-identified references only",
-                    type="constraint",
-                    required=True
-                ),
-                PromptComponent(
-                    name="limitations",
-                    content="Do not provide medical advice, focus on documentation and administrative aspects only",
-                    type="constraint",
-                    required=True
-                )
-            ],
-            variables={
-                "document_type": "string",
-                "analysis_purpose": "string",
-                "clinical_context": "string",
-                "focus_areas": "string"
-            },
-            validation_criteria=[
-                "Maintains HIPAA compliance",
-                "Focuses on documentation quality",
-                "Avoids medical advice",
-                "Recommends clinical review appropriately"
-            ],
-            expected_output_format="XML with medical_analysis structure including clinical_information, documentation_quality, recommendations"
-        )
+        return _create_medical_template()
     
     def create_general_template(self) -> PromptTemplate:
         """Create a general-purpose analysis template"""
-        return PromptTemplate(
-            name="general_analysis",
-            description="General-purpose document analysis and information extraction",
-            domain="general",
-            components=[
-                PromptComponent(
-                    name="role_definition",
-                    content="You are an AI assistant specialized in document analysis and information extraction",
-                    type="system",
-                    required=True
-                ),
-                PromptComponent(
-                    name="methodology",
-                    content="Systematic analysis approach: structure review, content extraction, quality assessment, recommendations",
-                    type="instruction",
-                    required=True
-                )
-            ],
-            variables={
-                "document_type": "string",
-                "analysis_goals": "string",
-                "output_format": "string",
-                "specific_requirements": "string"
-            },
-            validation_criteria=[
-                "Provides structured output",
-                "Includes confidence assessment",
-                "Acknowledges limitations",
-                "Offers actionable recommendations"
-            ],
-            expected_output_format="Structured format based on requirements, typically XML or JSON"
-        )
+        return _create_general_template()
     
     def build_prompt(self, template_name: str, variables: Dict[str, Any]) -> Dict[str, str]:
         """Build a complete prompt from template and variables"""
@@ -247,15 +401,8 @@ class PromptBuilder:
         
         template = self.templates[template_name]
         
-        # Build system prompt
-        system_components = [c for c in template.components if c.type == 'system']
-        context_components = [c for c in template.components if c.type == 'context']
-        instruction_components = [c for c in template.components if c.type == 'instruction']
-        constraint_components = [c for c in template.components if c.type == 'constraint']
-        
-        system_prompt = self._build_system_prompt(
-            system_components, context_components, instruction_components, constraint_components
-        )
+        # System prompt depends only on the template, so it is built once per template
+        system_prompt = template.system_prompt
         
         # Build user prompt
         user_prompt = self._build_user_prompt(template, variables)
@@ -267,94 +414,38 @@ class PromptBuilder:
             'variables': variables
         }
     
-    def _build_system_prompt(self, system_components, context_components, instruction_components, constraint_components) -> str:
-        """Build the system prompt from components"""
-        prompt_parts = []
-        
-        # Role definition
-        for component in system_components:
-            prompt_parts.append(component.content)
-        
-        # Context and domain knowledge
-        if context_components:
-            prompt_parts.append("\n<context>")
-            for component in context_components:
-                prompt_parts.append(component.content)
-            prompt_parts.append("</context>")
-        
-        # Instructions and methodology
-        if instruction_components:
-            prompt_parts.append("\n<methodology>")
-            for component in instruction_components:
-                prompt_parts.append(component.content)
-            prompt_parts.append("</methodology>")
-        
-        # Constraints and limitations
-        if constraint_components:
-            prompt_parts.append("\n<constraints>")
-            for component in constraint_components:
-                prompt_parts.append(component.content)
-            prompt_parts.append("</constraints>")
-        
-        return "\n".join(prompt_parts)
-    
     def _build_user_prompt(self, template: PromptTemplate, variables: Dict[str, Any]) -> str:
         """Build the user prompt with variable substitution"""
-        prompt_parts = []
-        
-        # Add variable content
-        if variables:
-            prompt_parts.append("<request_details>")
-            for key, value in variables.items():
-                if key in template.variables:
-                    prompt_parts.append(f"{key}: {value}")
-            prompt_parts.append("</request_details>")
-        
-        # Add output format requirements
-        prompt_parts.append(f"\n<output_format>")
-        prompt_parts.append(f"Please provide your analysis in the following format:")
-        prompt_parts.append(f"{template.expected_output_format}")
-        prompt_parts.append(f"</output_format>")
-        
-        # Add validation criteria
-        prompt_parts.append(f"\n<quality_requirements>")
-        prompt_parts.append("Ensure your response meets these criteria:")
-        for criterion in template.validation_criteria:
-            prompt_parts.append(f"- {criterion}")
-        prompt_parts.append("</quality_requirements>")
-        
-        return "\n".join(prompt_parts)
+        if not variables:
+            return template.user_prompt_suffix
+        
+        # Only the request details vary per call; the rest is the template's cached suffix
+        return "\n".join([
+            "<request_details>",
+            *(f"{key}: {value}" for key, value in variables.items() if key in template.variables),
+            "</request_details>",
+            template.user_prompt_suffix
+        ])
     
-    def test_prompt(self, template_name: str, variables: Dict[str, Any], test_content: str) -> Dict[str, Any]:
-        """Test a prompt with Claude and return results"""
+    def test_prompt(self, template_name: str, variables: Dict[str, Any], test_content: str,
+                    on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Test a prompt with Claude and return results, streaming text to on_text if given"""
         if not self.client:
             raise ValueError("API key required for testing prompts")
         
         prompt = self.build_prompt(template_name, variables)
         
-        # Prepare the full user message
-        full_user_message = f"{prompt['user']}\n\n<content_to_analyze>\n{test_content}\n</content_to_analyze>"
-        
         try:
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                temperature=0,
-                system=prompt['system'],
-                messages=[
-                    {"role": "user", "content": full_user_message}
-                ]
-            )
-            
-            return {
-                'success': True,
-                'response': response.content[0].text,
-                'usage': {
-                    'input_tokens': response.usage.input_tokens,
-                    'output_tokens': response.usage.output_tokens
-                },
-                'prompt_used': prompt
-            }
+            params = self._message_params(prompt, test_content)
+            if on_text is None:
+                response = self.client.messages.create(**params)
+            else:
+                # Stream so the caller sees text as it arrives instead of after the full completion
+                with self.client.messages.stream(**params) as stream:
+                    for text in stream.text_stream:
+                        on_text(text)
+                    response = stream.get_final_message()
+            return self._test_result(prompt, response)
         
         except Exception as e:
             return {
@@ -363,6 +454,66 @@ class PromptBuilder:
                 'prompt_used': prompt
             }
     
+    def test_prompts_batch(self, template_name: str, variables: Dict[str, Any], contents: List[str],
+                           max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """Test a prompt against several contents concurrently, results in input order"""
+        if not self.api_key:
+            raise ValueError("API key required for testing prompts")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        
+        prompt = self.build_prompt(template_name, variables)
+        from anthropic import AsyncAnthropic
+        
+        async def run_all() -> List[Dict[str, Any]]:
+            # Async clients are bound to their event loop, so each batch gets its own,
+            # closed before asyncio.run shuts the loop down
+            async with AsyncAnthropic(api_key=self.api_key) as client:
+                semaphore = asyncio.Semaphore(max_concurrency)
+                
+                async def run_one(test_content: str) -> Dict[str, Any]:
+                    async with semaphore:
+                        try:
+                            response = await client.messages.create(**self._message_params(prompt, test_content))
+                            return self._test_result(prompt, response)
+                        except Exception as e:
+                            return {
+                                'success': False,
+                                'error': str(e),
+                                'prompt_used': prompt
+                            }
+                
+                return await asyncio.gather(*(run_one(test_content) for test_content in contents))
+        
+        return asyncio.run(run_all())
+    
+    def _message_params(self, prompt: Dict[str, Any], test_content: str) -> Dict[str, Any]:
+        """Request parameters for testing a built prompt against some content"""
+        # Prepare the full user message
+        full_user_message = f"{prompt['user']}\n\n<content_to_analyze>\n{test_content}\n</content_to_analyze>"
+        
+        return {
+            'model': "claude-3-5-sonnet-20241022",
+            'max_tokens': 4000,
+            'temperature': 0,
+            'system': prompt['system'],
+            'messages': [
+                {"role": "user", "content": full_user_message}
+            ]
+        }
+    
+    def _test_result(self, prompt: Dict[str, Any], response: Any) -> Dict[str, Any]:
+        """Result dict for a successful test response"""
+        return {
+            'success': True,
+            'response': response.content[0].text,
+            'usage': {
+                'input_tokens': response.usage.input_tokens,
+                'output_tokens': response.usage.output_tokens
+            },
+            'prompt_used': prompt
+        }
+    
     def validate_prompt_quality(self, template_name: str, response: str) -> Dict[str, Any]:
         """Validate if a response meets the template's quality criteria"""
         if template_name not in self.templates:
@@ -371,9 +522,10 @@ class PromptBuilder:
         template = self.templates[template_name]
         validation_results = {}
         
-        # Check each validation criterion
-        for criterion in template.validation_criteria:
-            validation_results[criterion] = self._check_criterion(criterion, response)
+        # Check each validation criterion with the check chosen once per template
+        response_lower = response.lower()
+        for criterion, check in template.criterion_checks:
+            validation_results[criterion] = check(response, response_lower)
         
         # Check output format
         format_valid = self._check_output_format(template.expected_output_format, response)
@@ -385,22 +537,22 @@ class PromptBuilder:
             'overall_score': sum(validation_results.values()) / len(validation_results) if validation_results else 0
         }
     
-    def _check_criterion(self, criterion: str, response: str) -> bool:
-        """Check if response meets a specific quality criterion"""
-        criterion_lower = criterion.lower()
-        response_lower = response.lower()
+    def is_valid(self, template_name: str, response: str) -> bool:
+        """Pass/fail only: stops at the first criterion the response fails"""
+        if template_name not in self.templates:
+            return False
         
-        # Basic keyword-based validation (can be enhanced)
-        if 'confidence' in criterion_lower:
-            return 'confidence' in response_lower or '%' in response
-        elif 'evidence' in criterion_lower:
-            return 'evidence' in response_lower or 'section' in response_lower
-        elif 'xml' in criterion_lower or 'format' in criterion_lower:
-            return '<' in response and '>' in response
-        elif 'limitation' in criterion_lower:
-            return 'limitation' in response_lower or 'uncertain' in response_lower
+        template = self.templates[template_name]
+        response_lower = response.lower()
+        for _, check in template.criterion_checks:
+            if not check(response, response_lower):
+                return False
         
-        return True  # Default to pass for unknown criteria
+        return self._check_output_format(template.expected_output_format, response)
+    
+    def _check_criterion(self, criterion: str, response: str) -> bool:
+        """Check if response meets a specific quality criterion"""
+        return _criterion_check(criterion)(response, response.lower())
     
     def _check_output_format(self, expected_format: str, response: str) -> bool:
         """Check if response follows expected output format"""
@@ -414,18 +566,20 @@ class PromptBuilder:
     def save_template(self, template: PromptTemplate, filepath: str):
         """Save a template to file"""
         with open(filepath, 'w') as f:
-            json.dump(asdict(template), f, indent=2)
+            json.dump(template.to_dict(), f, indent=2)
     
     def load_template(self, filepath: str) -> PromptTemplate:
         """Load a template from file"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            return PromptTemplate(**data)
+        return PromptTemplate(**_load_json_file(filepath))
     
     def list_templates(self) -> List[str]:
         """List available templates"""
         return list(self.templates.keys())
     
+    def iter_template_summaries(self) -> Iterator[Tuple[str, str]]:
+        """Yield (name, description) for each available template"""
+        return ((name, template.description) for name, template in self.templates.items())
+    
     def get_template_info(self, template_name: str) -> Dict[str, Any]:
         """Get detailed information about a template"""
         if template_name not in self.templates:
@@ -443,6 +597,14 @@ class PromptBuilder:
             'created_date': template.created_date
         }
 
+def _parse_variables(value: Optional[str]) -> Dict[str, Any]:
+    """Variables from a JSON file path or an inline JSON string"""
+    if not value:
+        return {}
+    if os.path.exists(value):
+        return _load_json_file(value)
+    return json.loads(value)
+
 def main():
     """Command-line interface for the prompt builder"""
     parser = argparse.ArgumentParser(description='Claude Prompt Builder Tool')
@@ -467,6 +629,7 @@ def main():
     test_parser.add_argument('--variables', help='Variables JSON file or string')
     test_parser.add_argument('--content', help='Content file to analyze')
     test_parser.add_argument('--api-key', help='Anthropic API key')
+    test_parser.add_argument('--stream', action='store_true', help='Print the response as it is generated')
     
     args = parser.parse_args()
     
@@ -475,11 +638,9 @@ def main():
     builder = PromptBuilder(api_key=api_key)
     
     if args.command == 'list':
-        templates = builder.list_templates()
         print("Available templates:")
-        for template in templates:
-            info = builder.get_template_info(template)
-            print(f"  {template}: {info.get('description', 'No description')}")
+        for name, description in builder.iter_template_summaries():
+            print(f"  {name}: {description or 'No description'}")
     
     elif args.command == 'info':
         info = builder.get_template_info(args.template)
@@ -494,13 +655,7 @@ def main():
     
     elif args.command == 'build':
         # Parse variables
-        variables = {}
-        if args.variables:
-            if os.path.exists(args.variables):
-                with open(args.variables, 'r') as f:
-                    variables = json.load(f)
-            else:
-                variables = json.loads(args.variables)
+        variables = _parse_variables(args.variables)
         
         # Build prompt
         try:
@@ -525,13 +680,7 @@ def main():
             return
         
         # Parse variables
-        variables = {}
-        if args.variables:
-            if os.path.exists(args.variables):
-                with open(args.variables, 'r') as f:
-                    variables = json.load(f)
-            else:
-                variables = json.loads(args.variables)
+        variables = _parse_variables(args.variables)
         
         # Load content
         if os.path.exists(args.content):
@@ -542,13 +691,21 @@ def main():
         
         # Test prompt
         try:
-            result = builder.test_prompt(args.template, variables, content)
+            if args.stream:
+                print("Response:")
+                print("=" * 50)
+                result = builder.test_prompt(args.template, variables, content,
+                                             on_text=lambda text: print(text, end='', flush=True))
+                print()
+            else:
+                result = builder.test_prompt(args.template, variables, content)
             if result['success']:
                 print("Test successful!")
                 print(f"Tokens used: {result['usage']['input_tokens']} input, {result['usage']['output_tokens']} output")
-                print("\nResponse:")
-                print("=" * 50)
-                print(result['response'])
+                if not args.stream:
+                    print("\nResponse:")
+                    print("=" * 50)
+                    print(result['response'])
                 
                 # Validate quality
                 validation = builder.validate_prompt_quality(args.template, result['response'])
@@ -0,0 +1,62 @@
+# Tests for the assessment engine
+
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+ENGINE_PATH = Path(__file__).parent.parent / "assessments" / "assessment_engine.py"
+
+def load_engine_module():
+    """Load the assessment engine module from its file path."""
+    spec = importlib.util.spec_from_file_location("assessment_engine", ENGINE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope="module")
+def engine_module():
+    return load_engine_module()
+
+@pytest.fixture
+def engine(engine_module):
+    return engine_module.AssessmentEngine()
+
+def test_performance_analytics_returns_independent_copies(engine_module, engine):
+    """Test that editing returned analytics never changes later results."""
+    responses = [engine_module.StudentResponse("ch1_q2", "False", 5.0, 4)]
+    engine.submit_assessment("ch1_quiz", "student", responses, time.perf_counter())
+
+    first = engine.generate_performance_analytics()
+    first["total_assessments"] = 99
+    first["assessment_breakdown"]["ch1_quiz"]["attempts"] = 99
+    second = engine.generate_performance_analytics()
+
+    assert second["total_assessments"] == 1
+    assert second["assessment_breakdown"]["ch1_quiz"]["attempts"] == 1
+
+def test_choice_answers_accept_only_decimal_option_numbers(engine):
+    """Test that option numbers must be decimal digits, and other digit forms don't crash."""
+    check = engine.answer_checks["ch1_q1"]
+
+    assert check("2")
+    assert check(" 2 ")
+    assert not check("1")
+    assert not check("²")
+    assert check("١") == check("1")
+
+def test_evaluate_open_responses(engine_module, engine):
+    """Test that batch scoring matches scoring each response on its own."""
+    question = engine.questions["ch1_q3"]
+    answers = [question.correct_answer, "Fix the grammar.", ""]
+
+    results = engine.evaluate_open_responses("ch1_q3", answers)
+
+    assert results[0] is True
+    assert results[1:] == [False, False]
+    assert results == [
+        engine._score_response(question, engine_module.StudentResponse("ch1_q3", answer, 0.0, 3))
+        for answer in answers
+    ]
+    assert engine.evaluate_open_responses("missing_question", answers) == [False, False, False]
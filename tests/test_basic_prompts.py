@@ -0,0 +1,62 @@
+# Tests for the basic prompt examples' API request builders
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "code-examples" / "basic-prompts" / "examples.py"
+
+JOBS = [
+    ("version_1_basic", "Vehicle A turned left."),
+    ("version_2_1_improved", "Vehicle B ran a red light."),
+]
+
+def load_examples():
+    """Load the examples module from its hyphenated directory."""
+    spec = importlib.util.spec_from_file_location("basic_prompt_examples", EXAMPLES_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope="module")
+def examples():
+    return load_examples()
+
+def test_batch_request_entries(examples):
+    """Test that batch entries carry a unique custom_id and the single-request params."""
+    entries = examples.create_api_batch_request(JOBS)
+
+    assert [entry["custom_id"] for entry in entries] == ["version_1_basic-0", "version_2_1_improved-1"]
+    for entry, (version, content) in zip(entries, JOBS):
+        assert set(entry) == {"custom_id", "params"}
+        assert entry["params"] == examples.create_api_request(version, content)
+
+def test_cache_control_only_on_static_prompt_text(examples):
+    """Test that prompt text is marked for caching and caller content is not."""
+    params = examples.create_api_batch_request(JOBS)[1]["params"]
+    system_message, user_message = params["messages"]
+
+    assert [block["cache_control"] for block in system_message["content"]] == [{"type": "ephemeral"}]
+    static_block, content_block = user_message["content"]
+    assert static_block["cache_control"] == {"type": "ephemeral"}
+    assert content_block == {"type": "text", "text": JOBS[1][1]}
+
+def test_request_bytes_are_compact_json(examples):
+    """Test that the serialized request body decodes to the request dict."""
+    body = examples.create_api_request_bytes("version_2_1_improved", "Vehicle B ran a red light.")
+    request = examples.create_api_request("version_2_1_improved", "Vehicle B ran a red light.")
+
+    assert isinstance(body, bytes)
+    assert body == json.dumps(request, separators=(",", ":")).encode()
+
+def test_batch_file_is_json_lines(examples, tmp_path):
+    """Test that the batch file holds one entry per line, matching the in-memory entries."""
+    path = tmp_path / "batch.jsonl"
+
+    count = examples.write_api_batch_file(JOBS, str(path))
+
+    lines = path.read_bytes().splitlines()
+    assert count == len(lines) == len(JOBS)
+    assert [json.loads(line) for line in lines] == examples.create_api_batch_request(JOBS)
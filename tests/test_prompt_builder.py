@@ -0,0 +1,106 @@
+# Tests for the prompt builder tool
+
+import asyncio
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+TOOL_PATH = Path(__file__).parent.parent / "resources" / "tools" / "prompt-builder.py"
+
+def load_tool():
+    """Load the hyphenated tool module from its file path."""
+    spec = importlib.util.spec_from_file_location("prompt_builder", TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope="module")
+def tool():
+    return load_tool()
+
+@pytest.fixture
+def builder(tool):
+    return tool.PromptBuilder(api_key="test-key")
+
+class FakeAsyncAnthropic:
+    """Stand-in for the SDK's async client that records its lifecycle and concurrency."""
+
+    instances = []
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key
+        self.closed = False
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.messages = types.SimpleNamespace(create=self._create)
+        FakeAsyncAnthropic.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def _create(self, **params):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        content = params['messages'][0]['content']
+        return types.SimpleNamespace(
+            content=[types.SimpleNamespace(text=f"echo: {content}")],
+            usage=types.SimpleNamespace(input_tokens=10, output_tokens=5)
+        )
+
+@pytest.fixture
+def fake_anthropic(monkeypatch):
+    FakeAsyncAnthropic.instances = []
+    module = types.ModuleType("anthropic")
+    module.AsyncAnthropic = FakeAsyncAnthropic
+    monkeypatch.setitem(sys.modules, "anthropic", module)
+    return FakeAsyncAnthropic
+
+def test_template_with_null_created_date(builder, tmp_path):
+    """Test that template JSON with an explicit null created_date gets a date on load."""
+    template_path = tmp_path / "template.json"
+    template_path.write_text(json.dumps({
+        "name": "null_date",
+        "description": "Template saved without a date",
+        "domain": "general",
+        "components": [
+            {"name": "role", "content": "You are an analyst.", "type": "system"}
+        ],
+        "variables": {},
+        "validation_criteria": ["Uses XML tags"],
+        "expected_output_format": "XML",
+        "created_date": None
+    }), encoding="utf-8")
+
+    template = builder.load_template(str(template_path))
+
+    assert isinstance(template.created_date, str)
+    assert template.created_date
+
+def test_batch_rejects_invalid_max_concurrency(builder, fake_anthropic):
+    """Test that max_concurrency below 1 fails before any client is created."""
+    with pytest.raises(ValueError):
+        builder.test_prompts_batch("general_analysis", {}, ["content"], max_concurrency=0)
+
+    assert fake_anthropic.instances == []
+
+def test_batch_closes_client_and_limits_concurrency(builder, fake_anthropic):
+    """Test that batch results keep input order, respect the limit and close the client."""
+    contents = [f"document {i}" for i in range(6)]
+
+    results = builder.test_prompts_batch("general_analysis", {}, contents, max_concurrency=2)
+
+    assert [result['success'] for result in results] == [True] * len(contents)
+    assert all(content in result['response'] for result, content in zip(results, contents))
+    client, = fake_anthropic.instances
+    assert client.api_key == "test-key"
+    assert client.closed
+    assert client.peak_in_flight == 2
@@ -0,0 +1,94 @@
+# Tests for the response analyzer tool
+
+import importlib.util
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+TOOL_PATH = Path(__file__).parent.parent / "resources" / "tools" / "response-analyzer.py"
+
+def load_tool():
+    """Load the hyphenated tool module from its file path."""
+    spec = importlib.util.spec_from_file_location("response_analyzer", TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope="module")
+def tool():
+    return load_tool()
+
+@pytest.fixture
+def analyzer(tool):
+    return tool.ResponseAnalyzer(api_key="")
+
+def test_cache_handles_lone_surrogates(analyzer):
+    """Test that responses with unpaired surrogates are analyzed and cached."""
+    response = "<summary>Claim \ud800 approved</summary>"
+
+    first = analyzer.analyze_response(response)
+    second = analyzer.analyze_response(response)
+
+    assert len(analyzer._analysis_cache) == 1
+    assert first.overall_score == second.overall_score
+
+def test_cache_invalidated_by_in_place_framework_edit(analyzer):
+    """Test that editing a framework's metric list in place is not served stale results."""
+    response = "<summary>The claim is approved.</summary>"
+    before = analyzer.analyze_response(response)
+
+    metrics = analyzer.quality_frameworks['general_analysis']
+    metrics.append(replace(metrics[0], name="extra_clarity"))
+    after = analyzer.analyze_response(response)
+
+    assert len(analyzer._analysis_cache) == 2
+    assert "extra_clarity" not in before.metric_scores
+    assert "extra_clarity" in after.metric_scores
+
+def test_cache_evicts_least_recently_used(tool, analyzer, monkeypatch):
+    """Test that the cache stays bounded and drops the least recently used entry."""
+    monkeypatch.setattr(tool, "_ANALYSIS_CACHE_SIZE", 2)
+
+    analyzer.analyze_response("first")
+    analyzer.analyze_response("second")
+    analyzer.analyze_response("first")
+    analyzer.analyze_response("third")
+    assert len(analyzer._analysis_cache) == 2
+
+    # "second" was evicted, so analyzing it again adds an entry and evicts "first"
+    analyzer.analyze_response("second")
+    cached_keys = list(analyzer._analysis_cache)
+    analyzer.analyze_response("third")
+    assert list(analyzer._analysis_cache) == cached_keys[::-1]
+
+COMPARE_RESPONSES = [
+    "ok",
+    "<summary>First, the claim is approved.</summary>\n1. Coverage confirmed",
+    "<analysis>First, review the policy.</analysis>\n1. Coverage\n2. Liability\nFinally, approve.",
+]
+
+def ranking_indices(comparison):
+    return [entry['index'] for entry in comparison['rankings']]
+
+def test_compare_responses_top_one(analyzer):
+    """Test that top_k=1 keeps only the best response."""
+    full = analyzer.compare_responses(COMPARE_RESPONSES)
+    best = analyzer.compare_responses(COMPARE_RESPONSES, top_k=1)
+
+    assert ranking_indices(best) == ranking_indices(full)[:1]
+    assert best['best_response_index'] == full['best_response_index']
+    assert best['score_range'] == full['score_range']
+
+def test_compare_responses_top_k_beyond_length(analyzer):
+    """Test that a top_k larger than the input matches the full ranking."""
+    full = analyzer.compare_responses(COMPARE_RESPONSES)
+    limited = analyzer.compare_responses(COMPARE_RESPONSES, top_k=len(COMPARE_RESPONSES) + 5)
+
+    assert ranking_indices(limited) == ranking_indices(full)
+    assert limited['score_range'] == full['score_range']
+
+def test_compare_responses_rejects_zero_top_k(analyzer):
+    """Test that top_k below 1 is rejected."""
+    with pytest.raises(ValueError):
+        analyzer.compare_responses(COMPARE_RESPONSES, top_k=0)